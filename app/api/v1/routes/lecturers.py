@@ -4,6 +4,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.core.authentication.auth_middleware import get_current_token
 from app.core.database import get_db
+from app.core.responses import model_response
 from app.schemas.lecturers import LecturerCreate, LecturerPublic, LecturerUpdate, Page
 from app.schemas.token import TokenData
 from app.controllers.lecturers import LecturerController
@@ -18,7 +19,11 @@ async def get_all_lecturers(
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
     controller = LecturerController(db)
-    return await controller.get_all_lecturers(limit=limit, cursor=cursor)
+    page = await controller.get_all_lecturers(limit=limit, cursor=cursor)
+    return model_response(Page.model_construct(
+        items=[LecturerPublic.from_mongo(lecturer) for lecturer in page["items"]],
+        next_cursor=page["next_cursor"],
+    ))
 
 
 @router.get("/lecturers/{id}", response_model=LecturerPublic)
@@ -28,7 +33,7 @@ async def get_lecturer(
     # current_user: TokenData = Depends(get_current_token),
 ):
     controller = LecturerController(db)
-    return await controller.get_lecturer_by_id(id)
+    return model_response(LecturerPublic.from_mongo(await controller.get_lecturer_by_id(id)))
 
 
 @router.get("/lecturers/by-academic-id/{academic_id}", response_model=LecturerPublic)
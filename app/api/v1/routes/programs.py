@@ -4,6 +4,7 @@ from typing import List, Optional
 
 from app.core.authentication.auth_middleware import get_current_token
 from app.core.database import get_db
+from app.core.responses import model_response
 from app.schemas.programs import ProgramCreate, ProgramPublic, ProgramUpdate, Page, StudentDashboardResponse
 from app.schemas.token import TokenData
 from app.controllers.programs import ProgramController
@@ -18,7 +19,11 @@ async def get_all_programs(
     db: AsyncIOMotorDatabase = Depends(get_db),
 ):
     controller = ProgramController(db)
-    return await controller.get_all_programs(limit=limit, cursor=cursor)
+    page = await controller.get_all_programs(limit=limit, cursor=cursor)
+    return model_response(Page.model_construct(
+        items=[ProgramPublic.from_mongo(program) for program in page["items"]],
+        next_cursor=page["next_cursor"],
+    ))
 
 
 @router.get("/programs/{id}", response_model=ProgramPublic)
@@ -28,7 +33,7 @@ async def get_program(
     # current_user: TokenData = Depends(get_current_token),
 ):
     controller = ProgramController(db)
-    return await controller.get_program_by_id(id)
+    return model_response(ProgramPublic.from_mongo(await controller.get_program_by_id(id)))
 
 
 @router.post("/programs", response_model=ProgramPublic)
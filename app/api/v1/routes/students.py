@@ -4,6 +4,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.core.authentication.auth_middleware import get_current_token, RoleBasedAccessControl
 from app.core.database import get_db
+from app.core.responses import model_response
 from app.schemas.students import StudentCreate, StudentPublic, StudentUpdate, Page, StudentAssignmentRequest
 from app.schemas.token import TokenData
 from app.controllers.students import StudentController
@@ -19,7 +20,11 @@ async def get_all_students(
     current_user: TokenData = Depends(require_coordinator)
 ):
     controller = StudentController(db)
-    return await controller.get_all_students(limit=limit, cursor=cursor)
+    page = await controller.get_all_students(limit=limit, cursor=cursor)
+    return model_response(Page.model_construct(
+        items=[StudentPublic.from_mongo(student) for student in page["items"]],
+        next_cursor=page["next_cursor"],
+    ))
 
 
 @router.get("/students/detailed")
@@ -50,7 +55,7 @@ async def get_student(
     # current_user: TokenData = Depends(get_current_token),
 ):
     controller = StudentController(db)
-    return await controller.get_student_by_id(id)
+    return model_response(StudentPublic.from_mongo(await controller.get_student_by_id(id)))
 
 
 @router.get("/students/{id}/profile")
@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Query, responses
 from typing import Optional, List, Dict
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.core import ref_cache
 from app.core.authentication.auth_middleware import get_current_token, RoleBasedAccessControl
 from app.core.database import get_db
 from app.schemas.supervisors import (
@@ -29,6 +31,11 @@ async def get_all_supervisors(
     db: AsyncIOMotorDatabase = Depends(get_db),
     current_user: TokenData = Depends(require_coordinator)
 ):
+    """
+    List supervisors newest first, ordered by createdAt then _id.
+    Pass the returned next_cursor to fetch the next page; a bare supervisor _id
+    from older clients is still accepted and resumes after that supervisor.
+    """
     controller = SupervisorController(db)
     return await controller.get_all_supervisors(limit=limit, cursor=cursor)
 
@@ -196,32 +203,27 @@ async def get_supervisor_with_students(
         
         checkin_id = None
         if academic_year:
-            academic_year_doc = await db["academic_years"].find_one({"title": academic_year})
+            academic_year_doc = await ref_cache.get_academic_year_by_title(db, academic_year)
             if academic_year_doc:
-                checkin = await db["fypcheckins"].find_one({"academicYear": academic_year_doc["_id"]})
+                checkin = await ref_cache.get_checkin_by_academic_year(db, academic_year_doc["_id"])
                 if checkin:
                     checkin_id = checkin["_id"]
         
-        fyp_query = {
-            "$or": [
-                {"supervisor": lecturer_id},
-                {"supervisor": str(lecturer_id)}
-            ]
-        }
+        fyp_query = {"supervisor": lecturer_id}
         if checkin_id:
             fyp_query["checkin"] = checkin_id
         
-        fyps = await db["fyps"].find(fyp_query).to_list(None)
-        
-        groups = await db["groups"].find({
-            "$or": [
-                {"supervisor": lecturer_id},
-                {"supervisor": str(lecturer_id)}
-            ],
-            "status": {"$ne": "inactive"}
-        }).to_list(None)
+        # A supervisor can have many fyps; fetch them in a few large batches
+        fyps, groups = await asyncio.gather(
+            db["fyps"].find(fyp_query).batch_size(1000).to_list(None),
+            db["groups"].find({
+                "supervisor": lecturer_id,
+                "status": {"$ne": "inactive"}
+            }).to_list(None)
+        )
         
-        students_data = []
+        # Students assigned through fyps come first, then group members, each listed once
+        student_ids = []
         student_ids_seen = set()
         
         for fyp in fyps:
@@ -230,18 +232,47 @@ async def get_supervisor_with_students(
                 continue
             
             student_ids_seen.add(str(student_id))
-            
-            student = await db["students"].find_one({"_id": ObjectId(student_id) if isinstance(student_id, str) else student_id})
-            if not student or student.get("deleted"):
+            student_ids.append(student_id)
+        
+        for group in groups:
+            members = group.get("members", []) or group.get("students", [])
+            for member_id in members:
+                if str(member_id) in student_ids_seen:
+                    continue
+                
+                student_ids_seen.add(str(member_id))
+                student_ids.append(member_id)
+        
+        # Load the students, then their programs, with one $in query each and join them here
+        student_oids = [
+            ObjectId(student_id) if isinstance(student_id, str) else student_id
+            for student_id in student_ids
+            if isinstance(student_id, ObjectId) or ObjectId.is_valid(student_id)
+        ]
+        students_by_id = {
+            student["_id"]: student
+            async for student in db["students"].find({"_id": {"$in": student_oids}, "deleted": {"$ne": True}})
+        }
+        program_ids = {
+            ObjectId(student["program"]) for student in students_by_id.values()
+            if isinstance(student.get("program"), ObjectId)
+            or (isinstance(student.get("program"), str) and ObjectId.is_valid(student["program"]))
+        }
+        programs_by_id = {
+            program["_id"]: program
+            async for program in db["programs"].find({"_id": {"$in": list(program_ids)}})
+        } if program_ids else {}
+        
+        students_data = []
+        for student_oid in student_oids:
+            student = students_by_id.get(student_oid)
+            if not student:
                 continue
             
             program = None
-            if student.get("program"):
-                program_field = student["program"]
-                if isinstance(program_field, str) and ObjectId.is_valid(program_field):
-                    program = await db["programs"].find_one({"_id": ObjectId(program_field)})
-                elif isinstance(program_field, ObjectId):
-                    program = await db["programs"].find_one({"_id": program_field})
+            program_field = student.get("program")
+            if isinstance(program_field, ObjectId) or (isinstance(program_field, str) and ObjectId.is_valid(program_field)):
+                program = programs_by_id.get(ObjectId(program_field))
             
             student_name = f"{student.get('surname', '')} {student.get('otherNames', '')}".strip()
             
@@ -262,45 +293,6 @@ async def get_supervisor_with_students(
                 } if program else None,
             })
         
-        for group in groups:
-            members = group.get("members", []) or group.get("students", [])
-            for member_id in members:
-                if str(member_id) in student_ids_seen:
-                    continue
-                
-                student_ids_seen.add(str(member_id))
-                
-                student = await db["students"].find_one({"_id": ObjectId(member_id) if isinstance(member_id, str) else member_id})
-                if not student or student.get("deleted"):
-                    continue
-                
-                program = None
-                if student.get("program"):
-                    program_field = student["program"]
-                    if isinstance(program_field, str) and ObjectId.is_valid(program_field):
-                        program = await db["programs"].find_one({"_id": ObjectId(program_field)})
-                    elif isinstance(program_field, ObjectId):
-                        program = await db["programs"].find_one({"_id": program_field})
-                
-                student_name = f"{student.get('surname', '')} {student.get('otherNames', '')}".strip()
-                
-                students_data.append({
-                    "student_id": str(student["_id"]),
-                    "student_name": student_name,
-                    "surname": student.get("surname", ""),
-                    "otherNames": student.get("otherNames", ""),
-                    "email": student.get("email", ""),
-                    "phone": student.get("phone", ""),
-                    "student_image": student.get("image", ""),
-                    "academicId": student.get("academicId", ""),
-                    "program": {
-                        "program_id": str(program["_id"]) if program else None,
-                        "title": program.get("title", "") if program else None,
-                        "tag": program.get("tag", "") if program else None,
-                        "description": program.get("description", "") if program else None,
-                    } if program else None,
-                })
-        
         for student in students_data:
             # This is a placeholder - you'll need to implement actual project status logic
             # based on your business rules (e.g., based on deliverables, submissions, etc.)
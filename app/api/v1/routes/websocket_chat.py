@@ -79,8 +79,13 @@ async def get_user_info(db: AsyncIOMotorDatabase, user_id: str, user_type: str)
     return None
 
 @router.websocket("/ws/chat/{user_id}")
-async def websocket_endpoint(websocket: WebSocket, user_id: str, token: str = Query(...)):
-    """WebSocket endpoint for real-time chat"""
+async def websocket_endpoint(websocket: WebSocket, user_id: str, token: str = Query(...), batch: bool = Query(False)):
+    """
+    WebSocket endpoint for real-time chat.
+    Clients that connect with ?batch=true may receive several queued messages in one
+    {"type": "batch", "messages": [...]} frame and must handle each entry of `messages`
+    as a separate message; without it every message arrives in its own frame.
+    """
     logger.info(f"WebSocket connection attempt: user_id={user_id}, token={token[:20]}...")
     
     token_data = await authenticate_websocket(websocket, token)
@@ -112,7 +117,7 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str, token: str = Qu
     
     # Connect the user
     logger.info(f"Connecting user to WebSocket manager: user_id={actual_user_id}")
-    await manager.connect(websocket, actual_user_id, user_info)
+    await manager.connect(websocket, actual_user_id, user_info, batch=batch)
     logger.info(f"User connected successfully: user_id={actual_user_id}")
     
     try:
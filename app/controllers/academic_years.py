@@ -4,6 +4,8 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException
 
+from app.core import ref_cache
+
 
 class AcademicYearController:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -66,6 +68,7 @@ class AcademicYearController:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Academic year not found")
+        ref_cache.clear_academic_years()
 
         updated_academic_year = await self.collection.find_one({"_id": ObjectId(academic_year_id)})
         return updated_academic_year
@@ -78,6 +81,7 @@ class AcademicYearController:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Academic year not found")
+        ref_cache.clear_academic_years()
 
         return {"message": "Academic year deleted successfully"}
 
@@ -12,6 +12,21 @@ class DeliverableController:
         self.db = db
         self.collection = db["deliverables"]
 
+    async def _add_submission_counts(self, deliverables: List[dict]):
+        """Set total_submissions on each deliverable from one grouped count"""
+        if not deliverables:
+            return
+
+        counts = {
+            row["_id"]: row["count"]
+            async for row in self.db["submissions"].aggregate([
+                {"$match": {"deliverable_id": {"$in": [d["_id"] for d in deliverables]}}},
+                {"$group": {"_id": "$deliverable_id", "count": {"$sum": 1}}}
+            ])
+        }
+        for deliverable in deliverables:
+            deliverable["total_submissions"] = counts.get(deliverable["_id"], 0)
+
     async def get_all_deliverables(self, limit: int = 10, cursor: Optional[str] = None):
         query = {}
         if cursor:
@@ -20,11 +35,7 @@ class DeliverableController:
         deliverables = await self.collection.find(query).sort("start_date", -1).limit(limit).to_list(limit)
 
         # Calculate total submissions for each deliverable
-        for deliverable in deliverables:
-            submissions_count = await self.db["submissions"].count_documents(
-                {"deliverable_id": deliverable["_id"]}
-            )
-            deliverable["total_submissions"] = submissions_count
+        await self._add_submission_counts(deliverables)
 
         next_cursor = None
         if len(deliverables) == limit:
@@ -194,11 +205,7 @@ class DeliverableController:
         }).sort("start_date", -1).to_list(None)
 
         # Calculate total submissions for each deliverable
-        for deliverable in deliverables:
-            submissions_count = await self.db["submissions"].count_documents(
-                {"deliverable_id": deliverable["_id"]}
-            )
-            deliverable["total_submissions"] = submissions_count
+        await self._add_submission_counts(deliverables)
 
         return deliverables
 
@@ -210,11 +217,7 @@ class DeliverableController:
         }).sort("end_date", 1).to_list(None)
 
         # Calculate total submissions for each deliverable
-        for deliverable in deliverables:
-            submissions_count = await self.db["submissions"].count_documents(
-                {"deliverable_id": deliverable["_id"]}
-            )
-            deliverable["total_submissions"] = submissions_count
+        await self._add_submission_counts(deliverables)
 
         return deliverables
 
@@ -225,11 +228,7 @@ class DeliverableController:
         }).sort("start_date", 1).limit(limit).to_list(limit)
 
         # Calculate total submissions for each deliverable
-        for deliverable in deliverables:
-            submissions_count = await self.db["submissions"].count_documents(
-                {"deliverable_id": deliverable["_id"]}
-            )
-            deliverable["total_submissions"] = submissions_count
+        await self._add_submission_counts(deliverables)
 
         return deliverables
 
@@ -304,11 +303,8 @@ class DeliverableController:
         deliverables = await self.collection.find(deliverables_query).sort("start_date", -1).to_list(None)
 
         # 7. Enrich with submissions
+        await self._add_submission_counts(deliverables)
         for deliverable in deliverables:
-            # Total submissions
-            total = await self.db["submissions"].count_documents({"deliverable_id": deliverable["_id"]})
-            deliverable["total_submissions"] = total
-
             # Student submission
             student_sub = await self.db["submissions"].find_one({
                 "deliverable_id": deliverable["_id"],
@@ -297,7 +297,7 @@ class EnhancedSupervisorInterestController:
             "total_supervisors": 0,
             "supervisors_with_interests": 0,
             "average_interests_per_supervisor": 0,
-            "most_popular_areas_for_supervisors": {},
+            "most_popular_areas_for_supervisors": [],
             "supervisor_capacity_utilization": {},
             "matching_statistics": {}
         }
@@ -4,6 +4,8 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException
 
+from app.core import ref_cache
+
 
 class FypCheckinController:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -55,6 +57,7 @@ class FypCheckinController:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Checkin not found")
+        ref_cache.clear_checkins()
 
         updated_checkin = await self.collection.find_one({"_id": ObjectId(checkin_id)})
         return updated_checkin
@@ -64,6 +67,7 @@ class FypCheckinController:
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Checkin not found")
+        ref_cache.clear_checkins()
 
         return {"message": "Checkin deleted successfully"}
 
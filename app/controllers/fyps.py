@@ -4,6 +4,8 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException
 
+from app.controllers.supervisors import SupervisorController
+
 
 class FypController:
     """
@@ -119,6 +121,8 @@ class FypController:
                 raise HTTPException(status_code=404, detail=f"Project area with ID {project_area_field} not found")
 
         result = await self.collection.insert_one(fyp_data)
+        if fyp_data.get("supervisor"):
+            await SupervisorController(self.db).adjust_project_student_count(fyp_data["supervisor"], 1)
         created_fyp = await self.collection.find_one({"_id": result.inserted_id})
         return created_fyp
 
@@ -201,14 +205,22 @@ class FypController:
 
         update_data["updatedAt"] = datetime.utcnow()
 
-        result = await self.collection.update_one(
+        # The previous version tells whether the fyp moved to another supervisor
+        previous_fyp = await self.collection.find_one_and_update(
             {"_id": fyp_oid},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"supervisor": 1}
         )
 
-        if result.matched_count == 0:
+        if not previous_fyp:
             raise HTTPException(status_code=404, detail="FYP not found")
 
+        if "supervisor" in update_data and previous_fyp.get("supervisor") != update_data["supervisor"]:
+            supervisor_controller = SupervisorController(self.db)
+            if previous_fyp.get("supervisor"):
+                await supervisor_controller.adjust_project_student_count(previous_fyp["supervisor"], -1)
+            await supervisor_controller.adjust_project_student_count(update_data["supervisor"], 1)
+
         updated_fyp = await self.collection.find_one({"_id": fyp_oid})
         return updated_fyp
 
@@ -218,11 +230,14 @@ class FypController:
         except HTTPException:
             raise
 
-        result = await self.collection.delete_one({"_id": fyp_oid})
+        deleted_fyp = await self.collection.find_one_and_delete({"_id": fyp_oid}, projection={"supervisor": 1})
 
-        if result.deleted_count == 0:
+        if not deleted_fyp:
             raise HTTPException(status_code=404, detail="FYP not found")
 
+        if deleted_fyp.get("supervisor"):
+            await SupervisorController(self.db).adjust_project_student_count(deleted_fyp["supervisor"], -1)
+
         return {"message": "FYP deleted successfully"}
 
     async def get_fyps_by_group(self, group_id: str):
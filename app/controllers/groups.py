@@ -232,6 +232,9 @@ class GroupController:
 
 
     async def assign_groups_to_supervisor(self, group_ids: List[str], supervisor_id: str):
+        if not ObjectId.is_valid(supervisor_id):
+            raise HTTPException(status_code=400, detail=f"Invalid supervisor id: {supervisor_id}")
+
         supervisor = await self.db["supervisors"].find_one({"_id": ObjectId(supervisor_id)})
         if not supervisor:
             raise HTTPException(status_code=404, detail="Supervisor not found")
@@ -255,10 +258,10 @@ class GroupController:
                     errors.append(f"Group {group['name']} already has a supervisor assigned")
                     continue
 
-                # Assign supervisor directly to group
+                # Groups and fyps reference a supervisor by its lecturer's _id
                 await self.collection.update_one(
                     {"_id": group["_id"]},
-                    {"$set": {"supervisor": supervisor_id}}
+                    {"$set": {"supervisor": lecturer["_id"]}}
                 )
 
                 successful.append({
@@ -292,8 +295,13 @@ class GroupController:
         }
         
     async def unassign_groups_from_supervisor(self, supervisor_id: str):
+        if not ObjectId.is_valid(supervisor_id):
+            raise HTTPException(status_code=400, detail=f"Invalid supervisor id: {supervisor_id}")
+
+        # Groups reference the supervisor by its lecturer's _id; accept a lecturer _id passed directly too
+        supervisor = await self.db["supervisors"].find_one({"_id": ObjectId(supervisor_id)}, {"lecturer_id": 1})
         result = await self.collection.update_many(
-            {"supervisor": supervisor_id},
+            {"supervisor": ObjectId(supervisor["lecturer_id"]) if supervisor else ObjectId(supervisor_id)},
             {"$set": {"supervisor": None}}
         )
 
@@ -4,6 +4,7 @@ from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException
 from app.core.authentication.hashing import get_hash
+from app.core.cache import lecturer_cache
 
 
 class LecturerController:
@@ -200,6 +201,7 @@ class LecturerController:
 
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Lecturer not found")
+        lecturer_cache.invalidate(ObjectId(lecturer_id))
 
         updated_lecturer = await self.collection.find_one({"_id": ObjectId(lecturer_id)})
         return updated_lecturer
@@ -209,6 +211,7 @@ class LecturerController:
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Lecturer not found")
+        lecturer_cache.invalidate(ObjectId(lecturer_id))
 
         return {"message": "Lecturer deleted successfully"}
 
@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime
 from typing import Optional, List, Dict
 
@@ -5,6 +6,10 @@ from bson import ObjectId
 from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.controllers.supervisors import SupervisorController
+
+logger = logging.getLogger(__name__)
+
 
 class StudentController:
     def __init__(self, db: AsyncIOMotorDatabase):
@@ -89,19 +94,17 @@ class StudentController:
 
 
     async def get_students_by_project_area(self, project_area_id: str):
-        print("Searching FYPs for projectArea:", project_area_id)
+        logger.debug("Searching FYPs for projectArea: %s", project_area_id)
 
         # Build query that matches both string and ObjectId
         query = {"$or": [{"projectArea": project_area_id}]}
         try:
             query["$or"].append({"projectArea": ObjectId(project_area_id)})
         except Exception as e:
-            print("Invalid ObjectId format:", e)
+            logger.debug("projectArea %s is not an ObjectId: %s", project_area_id, e)
 
         fyps = await self.db["fyps"].find(query).to_list(None)
-        print(f"Found {len(fyps)} FYP(s)")
-        if fyps:
-            print("Example FYP:", fyps[0])
+        logger.debug("Found %d FYP(s) for projectArea %s", len(fyps), project_area_id)
 
         students_data = []
         for fyp in fyps:
@@ -117,7 +120,7 @@ class StudentController:
 
             student = await self.collection.find_one({"_id": student_obj_id})
             if not student:
-                print(f"No student found for FYP {fyp['_id']}")
+                logger.warning("No student found for FYP %s", fyp["_id"])
                 continue
 
             # Convert program_id safely
@@ -155,7 +158,7 @@ class StudentController:
                 "fyp_id": str(fyp["_id"]),
             })
 
-        print("Returning", len(students_data), "students")
+        logger.debug("Returning %d students for projectArea %s", len(students_data), project_area_id)
         return students_data
 
 
@@ -342,6 +345,7 @@ class StudentController:
                 }
 
                 result = await self.db["fyps"].insert_one(fyp_data)
+                await SupervisorController(self.db).adjust_project_student_count(lecturer["_id"], 1)
                 created_fyp = await self.db["fyps"].find_one({"_id": result.inserted_id})
 
                 created_assignments.append({
@@ -386,7 +390,7 @@ class StudentController:
                     }
                 })
             except Exception as log_error:
-                print("Failed to log activity:", log_error)
+                logger.warning("Failed to log activity: %s", log_error)
 
         # Return response
         return {
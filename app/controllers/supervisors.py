@@ -1,30 +1,176 @@
-from datetime import datetime
+import base64
+import binascii
+import logging
+from datetime import datetime, timezone
 from typing import Optional, List, Dict
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from fastapi import HTTPException
 
+from app.core import ref_cache
+from app.core.cache import lecturer_cache
+from app.schemas.supervisors import (
+    AcademicYearInfo,
+    LecturerDetailInfo,
+    ProjectAreaInfo,
+    SupervisorDetail,
+    SupervisorDetailInfo,
+)
+
+logger = logging.getLogger(__name__)
+
+# Index on fyps.supervisor (see app.core.database.INDEXES); pinned so counts skip query planning
+FYPS_SUPERVISOR_INDEX = [("supervisor", 1)]
+
+# Lecturer fields read by this controller; documents returned to clients as-is are not projected
+LECTURER_FIELDS = {
+    "surname": 1, "otherNames": 1, "email": 1, "phone": 1, "position": 1, "title": 1, "bio": 1,
+    "officeHours": 1, "officeLocation": 1, "academicId": 1, "max_students": 1, "createdAt": 1,
+    "updatedAt": 1, "department": 1, "specialization": 1, "image": 1,
+}
+SUPERVISOR_FIELDS = {"lecturer_id": 1, "max_students": 1, "createdAt": 1, "updatedAt": 1}
+# Only where the stored fyp count is read; it can be missing until backfill_supervisor_counts.py runs
+SUPERVISOR_COUNT_FIELDS = {**SUPERVISOR_FIELDS, "project_student_count": 1}
+FYP_FIELDS = {"supervisor": 1, "projectArea": 1, "checkin": 1, "createdAt": 1, "updatedAt": 1}
+PROJECT_AREA_FIELDS = {"title": 1, "description": 1, "image": 1}
+STUDENT_FIELDS = {"surname": 1, "otherNames": 1, "email": 1, "phone": 1, "academicId": 1, "program": 1, "level": 1}
+
+# Supervisors are paged newest first by (createdAt, _id); see app.core.database.INDEXES
+SUPERVISOR_PAGE_SORT = {"createdAt": -1, "_id": -1}
+
+
+def _full_name(person: dict) -> str:
+    return " ".join(part for part in (person.get("surname"), person.get("otherNames")) if part)
+
+
+def _to_oid(value) -> ObjectId:
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
+
+def _oid_or_400(value, field: str = "id") -> ObjectId:
+    if not ObjectId.is_valid(value):
+        raise HTTPException(status_code=400, detail=f"Invalid {field}: {value}")
+    return _to_oid(value)
+
+
+def _encode_cursor(doc: dict) -> str:
+    created_at = doc.get("createdAt")
+    key = f"{created_at.isoformat() if created_at else ''}|{doc['_id']}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _cursor_query(cursor: str) -> dict:
+    """Match the supervisors that sort after the cursor's (createdAt, _id) key"""
+    try:
+        created_at, oid = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        created_at = datetime.fromisoformat(created_at) if created_at else None
+        oid = ObjectId(oid)
+    except (ValueError, binascii.Error, UnicodeDecodeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Documents without createdAt sort after every dated one
+    if created_at is None:
+        return {"createdAt": None, "_id": {"$lt": oid}}
+    return {"$or": [
+        {"createdAt": {"$lt": created_at}},
+        {"createdAt": created_at, "_id": {"$lt": oid}},
+        {"createdAt": None},
+    ]}
+
 
 class SupervisorController:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db["supervisors"]
 
-    async def get_all_supervisors(self, limit: int = 10, cursor: Optional[str] = None):
-        query = {}
-        if cursor:
-            query["_id"] = {"$gt": ObjectId(cursor)}
+    async def _get_lecturer(self, lecturer_id: ObjectId):
+        lecturer = lecturer_cache.get(lecturer_id)
+        if lecturer is None:
+            lecturer = await self.db["lecturers"].find_one({"_id": lecturer_id}, projection=LECTURER_FIELDS)
+            if lecturer:
+                lecturer_cache.set(lecturer_id, lecturer)
+        return lecturer
+
+    async def _docs_by_field(self, collection: str, values: list, field: str = "_id", extra_query: Optional[dict] = None, projection: Optional[dict] = None) -> Dict:
+        """Fetch documents whose `field` is in `values` with one query, keyed by that field"""
+        query = {field: {"$in": list(values)}}
+        if extra_query:
+            query.update(extra_query)
+
+        docs = {}
+        async for doc in self.db[collection].find(query, projection=projection):
+            # Keep the first match per key, like the find_one calls this replaces
+            docs.setdefault(doc[field], doc)
+        return docs
+
+    async def _fill_student_counts(self, supervisors: List[dict]):
+        """Count fyps for supervisors whose project_student_count has not been backfilled yet"""
+        missing = [supervisor for supervisor in supervisors if "project_student_count" not in supervisor]
+        if not missing:
+            return
+
+        # fyps reference a supervisor by its own _id or by its lecturer's _id
+        refs = [ref for supervisor in missing for ref in (supervisor["_id"], supervisor.get("lecturer_id")) if ref]
+        counts = {
+            row["_id"]: row["count"]
+            async for row in self.db["fyps"].aggregate([
+                {"$match": {"supervisor": {"$in": refs}}},
+                {"$group": {"_id": "$supervisor", "count": {"$sum": 1}}}
+            ])
+        }
+        for supervisor in missing:
+            supervisor["project_student_count"] = counts.get(supervisor["_id"], 0) + counts.get(supervisor.get("lecturer_id"), 0)
 
-        supervisors_docs = await self.collection.find(query).limit(limit).to_list(limit)
+    async def get_all_supervisors(self, limit: int = 10, cursor: Optional[str] = None):
+        # Cursors issued before keyset paging were a bare supervisor _id; resume after that supervisor
+        if cursor and ObjectId.is_valid(cursor):
+            anchor = await self.collection.find_one({"_id": ObjectId(cursor)}, {"createdAt": 1})
+            if not anchor:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            cursor = _encode_cursor(anchor)
+        query = _cursor_query(cursor) if cursor else {}
+
+        # Join lecturers server-side instead of one query per supervisor.
+        # The page and whether another page follows come back together from $facet.
+        pipeline = [
+            {"$match": query},
+            {"$sort": SUPERVISOR_PAGE_SORT},
+            {"$limit": limit + 1},
+            {"$facet": {
+                "items": [
+                    {"$limit": limit},
+                    {"$project": SUPERVISOR_COUNT_FIELDS},
+                    {"$lookup": {
+                        "from": "lecturers",
+                        "localField": "lecturer_id",
+                        "foreignField": "_id",
+                        "as": "lecturer"
+                    }},
+                    {"$unwind": {"path": "$lecturer", "preserveNullAndEmptyArrays": True}},
+                    {"$project": {
+                        **SUPERVISOR_COUNT_FIELDS,
+                        "lecturer._id": 1, **{f"lecturer.{field}": 1 for field in LECTURER_FIELDS}
+                    }},
+                ],
+                "_meta": [{"$count": "n"}]
+            }}
+        ]
+        page = (await self.collection.aggregate(pipeline).to_list(1))[0]
+        supervisors_docs = page["items"]
+        await self._fill_student_counts(supervisors_docs)
+        has_more = bool(page["_meta"]) and page["_meta"][0]["n"] > limit
 
         supervisors = []
         for doc in supervisors_docs:
-            lecturer = await self.db["lecturers"].find_one({"_id": doc.get("lecturer_id")})
+            lecturer = doc.get("lecturer")
             if lecturer:
-                student_count = await self.db["fyps"].count_documents({"supervisor": doc.get("_id")})
+                student_count = doc["project_student_count"]
 
                 # Create complete supervisor information
-                supervisor_name = f"{lecturer.get('surname', '')} {lecturer.get('otherNames', '')}".strip()
+                supervisor_name = _full_name(lecturer)
                 
                 supervisors.append({
                     "_id": str(doc.get("_id")),
@@ -45,8 +191,8 @@ class SupervisorController:
                 })
 
         next_cursor = None
-        if len(supervisors_docs) == limit:
-            next_cursor = str(supervisors_docs[-1]["_id"])
+        if has_more:
+            next_cursor = _encode_cursor(supervisors_docs[-1])
 
         return {
             "items": supervisors,
@@ -55,18 +201,19 @@ class SupervisorController:
 
     async def get_supervisor_by_id(self, supervisor_id: str):
         # Find supervisor entry in supervisors collection
-        supervisor = await self.collection.find_one({"_id": ObjectId(supervisor_id)})
+        supervisor = await self.collection.find_one(
+            {"_id": _oid_or_400(supervisor_id, "supervisor id")}, projection=SUPERVISOR_COUNT_FIELDS
+        )
         if not supervisor:
             raise HTTPException(status_code=404, detail="Supervisor not found")
+        await self._fill_student_counts([supervisor])
 
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor.get("lecturer_id")})
+        lecturer = await self._get_lecturer(supervisor.get("lecturer_id"))
         if not lecturer:
             raise HTTPException(status_code=404, detail="Lecturer not found")
 
-        student_count = await self.db["fyps"].count_documents({"supervisor": lecturer["_id"]})
-
         # Create complete supervisor information
-        supervisor_name = f"{lecturer.get('surname', '')} {lecturer.get('otherNames', '')}".strip()
+        supervisor_name = _full_name(lecturer)
         
         supervisor_data = {
             "_id": str(supervisor["_id"]),
@@ -81,7 +228,7 @@ class SupervisorController:
             "office_location": lecturer.get("officeLocation", ""),
             "academic_id": lecturer.get("academicId", ""),
             "max_students": supervisor.get("max_students", lecturer.get("max_students", 5)),
-            "current_students": student_count,
+            "current_students": supervisor["project_student_count"],
             "createdAt": supervisor.get("createdAt", lecturer.get("createdAt")),
             "updatedAt": supervisor.get("updatedAt", lecturer.get("updatedAt"))
         }
@@ -90,101 +237,136 @@ class SupervisorController:
 
     async def create_supervisor(self, supervisor_data: dict):
         # Convert lecturer_id to ObjectId if it's a string
-        if "lecturer_id" in supervisor_data and isinstance(supervisor_data["lecturer_id"], str):
-            supervisor_data["lecturer_id"] = ObjectId(supervisor_data["lecturer_id"])
+        if "lecturer_id" in supervisor_data:
+            supervisor_data["lecturer_id"] = _oid_or_400(supervisor_data["lecturer_id"], "lecturer id")
 
         # Check if lecturer exists
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor_data["lecturer_id"]})
+        lecturer = await self._get_lecturer(supervisor_data["lecturer_id"])
         if not lecturer:
             raise HTTPException(status_code=404, detail="Lecturer not found")
 
         # Check if supervisor already exists for this lecturer
-        existing_supervisor = await self.collection.find_one({"lecturer_id": supervisor_data["lecturer_id"]})
+        existing_supervisor = await self.collection.find_one({"lecturer_id": supervisor_data["lecturer_id"]}, {"_id": 1})
         if existing_supervisor:
             raise HTTPException(status_code=400, detail="Supervisor already exists for this lecturer")
 
-        supervisor_data["createdAt"] = datetime.now()
-        supervisor_data["updatedAt"] = datetime.now()
+        now = datetime.now(timezone.utc)
+        supervisor_data["createdAt"] = supervisor_data["updatedAt"] = now
 
-        result = await self.collection.insert_one(supervisor_data)
-        created_supervisor = await self.collection.find_one({"_id": result.inserted_id})
+        # A new supervisor can only be referenced by its lecturer's _id so far
+        supervisor_data["project_student_count"] = await self.db["fyps"].count_documents(
+            {"supervisor": supervisor_data["lecturer_id"]}, hint=FYPS_SUPERVISOR_INDEX
+        )
 
-        # compute project student count from fyps collection (use lecturer _id)
+        # The unique index on lecturer_id also catches a concurrent insert for the same lecturer
         try:
-            supervisor_id = created_supervisor.get("supervisor_id") or supervisor_data["supervisor_id"]
-            # ensure ObjectId if necessary
-            if isinstance(supervisor_id, str):
-                supervisor_id = ObjectId(supervisor_id)
-            count = await self.db["fyps"].count_documents({"supervisor": supervisor_id})
-        except Exception:
-            count = 0
-
-        created_supervisor["project_student_count"] = count
+            result = await self.collection.insert_one(supervisor_data)
+        except DuplicateKeyError:
+            raise HTTPException(status_code=400, detail="Supervisor already exists for this lecturer")
 
-        return created_supervisor
+        # insert_one sets _id on supervisor_data, so there is nothing to re-read
+        return {**supervisor_data, "_id": result.inserted_id}
 
     async def update_supervisor(self, supervisor_id: str, update_data: dict):
+        oid = _oid_or_400(supervisor_id, "supervisor id")
         update_data = {k: v for k, v in update_data.items() if v is not None}
 
         if not update_data:
             raise HTTPException(status_code=400, detail="No valid fields to update")
 
         # Convert lecturer_id to ObjectId if it's a string
-        if "lecturer_id" in update_data and isinstance(update_data["lecturer_id"], str):
-            update_data["lecturer_id"] = ObjectId(update_data["lecturer_id"])
+        if "lecturer_id" in update_data:
+            update_data["lecturer_id"] = _oid_or_400(update_data["lecturer_id"], "lecturer id")
 
         # If updating lecturer_id, check if lecturer exists
         if "lecturer_id" in update_data:
-            lecturer = await self.db["lecturers"].find_one({"_id": update_data["lecturer_id"]})
+            lecturer = await self._get_lecturer(update_data["lecturer_id"])
             if not lecturer:
                 raise HTTPException(status_code=404, detail="Lecturer not found")
+            existing_supervisor = await self.collection.find_one(
+                {"lecturer_id": update_data["lecturer_id"], "_id": {"$ne": oid}}, {"_id": 1}
+            )
+            if existing_supervisor:
+                raise HTTPException(status_code=400, detail="Supervisor already exists for this lecturer")
 
-        update_data["updatedAt"] = datetime.now()
+        update_data["updatedAt"] = datetime.now(timezone.utc)
 
-        result = await self.collection.update_one(
-            {"_id": ObjectId(supervisor_id)},
-            {"$set": update_data}
-        )
+        try:
+            updated_supervisor = await self.collection.find_one_and_update(
+                {"_id": oid},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            raise HTTPException(status_code=400, detail="Supervisor already exists for this lecturer")
 
-        if result.matched_count == 0:
+        if not updated_supervisor:
             raise HTTPException(status_code=404, detail="Supervisor not found")
 
-        updated_supervisor = await self.collection.find_one({"_id": ObjectId(supervisor_id)})
-
-        # Add project student count
-        count = await self.db["fyps"].count_documents({"supervisor": updated_supervisor.get("lecturer_id")})
-        updated_supervisor["project_student_count"] = count
+        # Fyps reference the supervisor by its own _id or its lecturer's _id, so a new lecturer changes the count.
+        # Recount only once the new lecturer is stored, so $inc updates from fyp writes before that are not overwritten
+        if "lecturer_id" in update_data:
+            count = await self.db["fyps"].count_documents(
+                {"supervisor": {"$in": [oid, update_data["lecturer_id"]]}}, hint=FYPS_SUPERVISOR_INDEX
+            )
+            updated_supervisor = await self.collection.find_one_and_update(
+                {"_id": oid},
+                {"$set": {"project_student_count": count}},
+                return_document=ReturnDocument.AFTER
+            ) or updated_supervisor
+        await self._fill_student_counts([updated_supervisor])
 
         return updated_supervisor
 
+    async def adjust_project_student_count(self, supervisor_ref, delta: int):
+        """Apply `delta` to the stored fyp count of the supervisor an fyp references, by supervisor or lecturer _id"""
+        if not ObjectId.is_valid(supervisor_ref):
+            logger.warning("Not adjusting project_student_count by %s for invalid supervisor ref %r", delta, supervisor_ref)
+            return
+        supervisor_ref = _to_oid(supervisor_ref)
+
+        # Supervisors without the counter have not been backfilled and are counted on read instead
+        await self.collection.update_one(
+            {"$or": [{"_id": supervisor_ref}, {"lecturer_id": supervisor_ref}], "project_student_count": {"$exists": True}},
+            {"$inc": {"project_student_count": delta}}
+        )
+
     async def delete_supervisor(self, supervisor_id: str):
-        result = await self.collection.delete_one({"_id": ObjectId(supervisor_id)})
+        oid = _oid_or_400(supervisor_id, "supervisor id")
+        result = await self.collection.delete_one({"_id": oid})
 
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Supervisor not found")
 
         return {"message": "Supervisor deleted successfully"}
 
-    async def get_supervisor_with_lecturer(self, supervisor_id: str):
-        supervisor = await self.collection.find_one({"_id": ObjectId(supervisor_id)})
-        if not supervisor:
+    async def _get_supervisor_and_lecturer(self, supervisor_id: str):
+        """Fetch a supervisor together with its lecturer in one aggregation"""
+        pipeline = [
+            {"$match": {"_id": _oid_or_400(supervisor_id, "supervisor id")}},
+            {"$lookup": {
+                "from": "lecturers",
+                "localField": "lecturer_id",
+                "foreignField": "_id",
+                "as": "lecturer"
+            }},
+            {"$unwind": {"path": "$lecturer", "preserveNullAndEmptyArrays": True}},
+        ]
+
+        docs = await self.collection.aggregate(pipeline).to_list(1)
+        if not docs:
             raise HTTPException(status_code=404, detail="Supervisor not found")
 
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor.get("lecturer_id")})
+        supervisor = docs[0]
+        lecturer = supervisor.pop("lecturer", None)
         if not lecturer:
             raise HTTPException(status_code=404, detail="Lecturer not found")
 
-        return {
-            "supervisor": supervisor,
-            "lecturer": lecturer
-        }
+        await self._fill_student_counts([supervisor])
+        return supervisor, lecturer
 
     async def get_supervisor_with_lecturer(self, supervisor_id: str):
-        supervisor = await self.get_supervisor_by_id(supervisor_id)
-
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor["lecturer_id"]})
-        if not lecturer:
-            raise HTTPException(status_code=404, detail="Lecturer not found")
+        supervisor, lecturer = await self._get_supervisor_and_lecturer(supervisor_id)
 
         return {
             "supervisor": supervisor,
@@ -194,67 +376,94 @@ class SupervisorController:
     async def get_all_supervisors_with_lecturer_details(self, limit: int = 10, cursor: Optional[str] = None, academic_year: Optional[str] = None):
         lecturers_query = {}
         if cursor:
-            try:
-                lecturers_query["_id"] = {"$gt": ObjectId(cursor)}
-            except Exception:
-                pass
-
-        lecturers = await self.db["lecturers"].find(lecturers_query).limit(limit).to_list(limit)
+            lecturers_query["_id"] = {"$gt": _oid_or_400(cursor, "cursor")}
 
         checkin_id = None
         if academic_year:
-            academic_year_doc = await self.db["academic_years"].find_one({"title": academic_year})
+            academic_year_doc = await ref_cache.get_academic_year_by_title(self.db, academic_year)
             if academic_year_doc:
-                checkin = await self.db["fypcheckins"].find_one({"academicYear": academic_year_doc["_id"]})
+                checkin = await ref_cache.get_checkin_by_academic_year(self.db, academic_year_doc["_id"])
                 if checkin:
                     checkin_id = checkin["_id"]
 
+        # supervisor references are ObjectIds (see migrate_supervisor_refs.py)
+        supervisor_is_lecturer = {"$eq": ["$supervisor", "$$lid"]}
+        fyp_match = {"$expr": supervisor_is_lecturer}
+        if checkin_id:
+            fyp_match["checkin"] = checkin_id
+
+        # Supervisor record, fyp and group student counts and the first project area
+        # of each lecturer on the page are joined server-side in one aggregation
+        pipeline = [
+            {"$match": lecturers_query},
+            {"$sort": {"_id": 1}},
+            {"$limit": limit},
+            {"$project": LECTURER_FIELDS},
+            {"$lookup": {
+                "from": "supervisors",
+                "localField": "_id",
+                "foreignField": "lecturer_id",
+                "as": "supervisor"
+            }},
+            {"$lookup": {
+                "from": "fyps",
+                "let": {"lid": "$_id"},
+                "pipeline": [
+                    {"$match": fyp_match},
+                    {"$count": "count"}
+                ],
+                "as": "fyp_count"
+            }},
+            # A group's size is its members list, falling back to students when members is empty
+            {"$lookup": {
+                "from": "groups",
+                "let": {"lid": "$_id"},
+                "pipeline": [
+                    {"$match": {"status": {"$ne": "inactive"}, "$expr": supervisor_is_lecturer}},
+                    {"$group": {"_id": None, "count": {"$sum": {"$size": {"$cond": [
+                        {"$gt": [{"$size": {"$ifNull": ["$members", []]}}, 0]},
+                        "$members",
+                        {"$ifNull": ["$students", []]}
+                    ]}}}}}
+                ],
+                "as": "group_count"
+            }},
+            {"$lookup": {
+                "from": "lecturer_project_areas",
+                "localField": "_id",
+                "foreignField": "lecturer",
+                "as": "lpa"
+            }},
+            # Only the first project area of each lecturer is shown
+            {"$addFields": {"first_project_area": {"$let": {
+                "vars": {"first": {"$arrayElemAt": [{"$ifNull": [{"$arrayElemAt": ["$lpa.projectAreas", 0]}, []]}, 0]}},
+                "in": {"$cond": [{"$isArray": "$$first"}, {"$arrayElemAt": ["$$first", 0]}, "$$first"]}
+            }}}},
+            {"$lookup": {
+                "from": "project_areas",
+                "localField": "first_project_area",
+                "foreignField": "_id",
+                "as": "project_area"
+            }},
+            {"$project": {
+                **LECTURER_FIELDS,
+                "supervisor": {"$arrayElemAt": ["$supervisor", 0]},
+                "student_count": {"$add": [
+                    {"$ifNull": [{"$arrayElemAt": ["$fyp_count.count", 0]}, 0]},
+                    {"$ifNull": [{"$arrayElemAt": ["$group_count.count", 0]}, 0]}
+                ]},
+                "project_area": {"$arrayElemAt": ["$project_area.title", 0]}
+            }}
+        ]
+        lecturers = await self.db["lecturers"].aggregate(pipeline).to_list(limit)
+
         supervisors_with_details = []
         for lecturer in lecturers:
             lecturer_id = lecturer["_id"]
-            
-            supervisor_doc = await self.collection.find_one({"lecturer_id": lecturer_id})
-            
-            lecturer_name = f"{lecturer.get('surname', '')} {lecturer.get('otherNames', '')}".strip()
-            
-            fyp_query = {
-                "$or": [
-                    {"supervisor": lecturer_id},
-                    {"supervisor": str(lecturer_id)}
-                ]
-            }
-            if checkin_id:
-                fyp_query["checkin"] = checkin_id
-            
-            student_count_fyps = await self.db["fyps"].count_documents(fyp_query)
-            
-            groups = await self.db["groups"].find({
-                "$or": [
-                    {"supervisor": lecturer_id},
-                    {"supervisor": str(lecturer_id)}
-                ],
-                "status": {"$ne": "inactive"}
-            }).to_list(None)
-            
-            student_count_groups = 0
-            for group in groups:
-                members = group.get("members", []) or group.get("students", [])
-                if members:
-                    student_count_groups += len(members)
-            
-            total_student_count = student_count_fyps + student_count_groups
-            
-            project_area = None
-            lpa = await self.db["lecturer_project_areas"].find_one({"lecturer": lecturer_id})
-            if lpa and lpa.get("projectAreas") and len(lpa["projectAreas"]) > 0:
-                project_area_id = lpa["projectAreas"][0]
-                if isinstance(project_area_id, list):
-                    project_area_id = project_area_id[0] if project_area_id else None
-                
-                if project_area_id:
-                    pa_doc = await self.db["project_areas"].find_one({"_id": project_area_id})
-                    if pa_doc:
-                        project_area = pa_doc.get("title", "")
+            supervisor_doc = lecturer.get("supervisor")
+
+            lecturer_name = _full_name(lecturer)
+            project_area = lecturer.get("project_area")
 
             supervisor_id = str(supervisor_doc["_id"]) if supervisor_doc else None
 
@@ -262,7 +471,7 @@ class SupervisorController:
                 "_id": supervisor_id or str(lecturer_id),
                 "lecturer_id": str(lecturer_id),
                 "max_students": supervisor_doc.get("max_students", lecturer.get("max_students", 5)) if supervisor_doc else lecturer.get("max_students", 5),
-                "project_student_count": total_student_count,
+                "project_student_count": lecturer["student_count"],
                 "createdAt": supervisor_doc.get("createdAt", lecturer.get("createdAt")) if supervisor_doc else lecturer.get("createdAt"),
                 "updatedAt": supervisor_doc.get("updatedAt", lecturer.get("updatedAt")) if supervisor_doc else lecturer.get("updatedAt"),
                 "lecturer_name": lecturer_name,
@@ -290,171 +499,148 @@ class SupervisorController:
         }
 
     async def get_lecturer_by_supervisor_id(self, supervisor_id: str):
-        supervisor = await self.collection.find_one({"_id": ObjectId(supervisor_id)})
-        if not supervisor:
-            raise HTTPException(status_code=404, detail="Supervisor not found")
-
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor.get("lecturer_id")})
-        if not lecturer:
-            raise HTTPException(status_code=404, detail="Lecturer not found")
-
+        _, lecturer = await self._get_supervisor_and_lecturer(supervisor_id)
         return lecturer
 
     async def get_supervisors_by_academic_year(self, academic_year_id: str):
-        checkin = await self.db["fypcheckins"].find_one({"academicYear": academic_year_id})
-        if not checkin:
-            return []
-
-        fyps = await self.db["fyps"].find({"checkin": checkin["_id"]}).to_list(None)
+        supervisors, _ = await self._get_supervisors_by_academic_year(academic_year_id)
+        return supervisors
 
-        supervisor_ids = list({fyp["supervisor"] for fyp in fyps if fyp.get("supervisor")})
+    async def _get_supervisors_by_academic_year(self, academic_year_id: str):
+        """Return the academic year's supervisors along with the lecturer documents read for them"""
+        checkin = await ref_cache.get_checkin_by_academic_year(self.db, academic_year_id)
+        if not checkin:
+            return [], {}
+
+        # Count fyps per supervisor server-side instead of pulling every fyp document
+        pipeline = [
+            {"$match": {"checkin": checkin["_id"]}},
+            {"$group": {"_id": "$supervisor", "count": {"$sum": 1}}}
+        ]
+        rows = await self.db["fyps"].aggregate(pipeline).to_list(None)
+
+        student_counts = {row["_id"]: row["count"] for row in rows if row["_id"]}
+        supervisor_ids = list(student_counts)
+        if not supervisor_ids:
+            return [], {}
+
+        # One $in query for the supervisors and one for their lecturers
+        supervisors_by_id = await self._docs_by_field(
+            "supervisors", supervisor_ids,
+            projection=SUPERVISOR_FIELDS
+        )
+        lecturers_by_id = await self._docs_by_field(
+            "lecturers",
+            {doc.get("lecturer_id") for doc in supervisors_by_id.values()},
+            projection=LECTURER_FIELDS
+        )
 
         supervisors = []
         for supervisor_id in supervisor_ids:
-            supervisor_doc = await self.collection.find_one({"_id": supervisor_id})
+            supervisor_doc = supervisors_by_id.get(supervisor_id)
             if not supervisor_doc:
                 continue
 
-            lecturer = await self.db["lecturers"].find_one({"_id": supervisor_doc.get("lecturer_id")})
+            lecturer = lecturers_by_id.get(supervisor_doc.get("lecturer_id"))
             if not lecturer:
                 continue
 
-            student_count = len([fyp for fyp in fyps if fyp.get("supervisor") == supervisor_id])
-
             supervisors.append({
                 "_id": supervisor_doc["_id"],
                 "lecturer_id": lecturer["_id"],
                 "max_students": supervisor_doc.get("max_students", lecturer.get("max_students")),
-                "project_student_count": student_count,
+                "project_student_count": student_counts[supervisor_id],
                 "createdAt": supervisor_doc.get("createdAt", lecturer.get("createdAt")),
                 "updatedAt": supervisor_doc.get("updatedAt", lecturer.get("updatedAt")),
                 "academic_id": lecturer.get("academicId"),
             })
 
-        return supervisors
+        return supervisors, lecturers_by_id
 
     async def get_supervisors_by_academic_year_detailed(self, academic_year_id: str):
-        # Get basic supervisors for this academic year
-        supervisors = await self.get_supervisors_by_academic_year(academic_year_id)
-
-        # Get academic year details
-        academic_year = await self.db["academic_years"].find_one({"_id": ObjectId(academic_year_id)})
+        academic_year_oid = _oid_or_400(academic_year_id, "academic year id")
 
-        detailed_supervisors = []
-        for supervisor in supervisors:
-            lecturer_id = supervisor["lecturer_id"]
-            lecturer = await self.db["lecturers"].find_one({"_id": lecturer_id})
-
-            # Get lecturer's project areas for this academic year
-            lpa = await self.db["lecturer_project_areas"].find_one({
-                "lecturer": lecturer_id,
-                "academicYear": ObjectId(academic_year_id)
-            })
-
-            project_areas = []
-            if lpa and lpa.get("projectAreas"):
-                for pa_id in lpa["projectAreas"]:
-                    pa = await self.db["project_areas"].find_one({"_id": pa_id})
-                    if pa:
-                        project_areas.append({
-                            "project_area_id": str(pa["_id"]),
-                            "title": pa.get("title", ""),
-                            "description": pa.get("description", ""),
-                            "image": pa.get("image", "")
-                        })
-
-            detailed_supervisor = {
-                "supervisor": {
-                    "supervisor_id": str(supervisor["_id"]),
-                    "academic_id": supervisor.get("academic_id", ""),
-                    "max_students": supervisor.get("max_students"),
-                    "project_student_count": supervisor.get("project_student_count", 0),
-                    "createdAt": supervisor.get("createdAt"),
-                    "updatedAt": supervisor.get("updatedAt")
-                },
-                "lecturer": {
-                    "lecturer_id": str(lecturer["_id"]) if lecturer else None,
-                    "name": f"{lecturer.get('surname', '')} {lecturer.get('otherNames', '')}".strip() if lecturer else None,
-                    "email": lecturer.get("email", "") if lecturer else None,
-                    "phone": lecturer.get("phone", "") if lecturer else None,
-                    "department": lecturer.get("department", "") if lecturer else None,
-                    "title": lecturer.get("title", "") if lecturer else None,
-                    "specialization": lecturer.get("specialization", "") if lecturer else None,
-                    "academic_id": lecturer.get("academicId", "") if lecturer else None
-                } if lecturer else None,
-                "academic_year": {
-                    "academic_year_id": str(academic_year["_id"]) if academic_year else None,
-                    "title": academic_year.get("title", "") if academic_year else None,
-                    "status": academic_year.get("status", "") if academic_year else None,
-                    "terms": academic_year.get("terms", 0) if academic_year else None,
-                    "current_term": academic_year.get("currentTerm", 0) if academic_year else None
-                } if academic_year else None,
-                "project_areas": project_areas
-            }
-            detailed_supervisors.append(detailed_supervisor)
-
-        return detailed_supervisors
-
-    async def get_supervisors_by_academic_year_detailed(self, academic_year_id: str):
-        # Get basic supervisors for this academic year
-        supervisors = await self.get_supervisors_by_academic_year(academic_year_id)
+        # Get basic supervisors for this academic year, reusing the lecturers read for them
+        supervisors, lecturers_by_id = await self._get_supervisors_by_academic_year(academic_year_id)
 
         # Get academic year details
-        academic_year = await self.db["academic_years"].find_one({"_id": ObjectId(academic_year_id)})
+        academic_year = await ref_cache.get_academic_year(self.db, academic_year_id)
+        academic_year_info = AcademicYearInfo.model_construct(
+            academic_year_id=str(academic_year["_id"]),
+            title=academic_year.get("title", ""),
+            status=academic_year.get("status", ""),
+            terms=academic_year.get("terms", 0),
+            current_term=academic_year.get("currentTerm", 0)
+        ) if academic_year else None
+
+        # Fetch the lecturers' project areas for this academic year joined with
+        # the referenced project areas in one aggregation
+        lecturer_ids = [supervisor["lecturer_id"] for supervisor in supervisors]
+        pipeline = [
+            {"$match": {"lecturer": {"$in": lecturer_ids}, "academicYear": academic_year_oid}},
+            {"$lookup": {
+                "from": "project_areas",
+                "localField": "projectAreas",
+                "foreignField": "_id",
+                "as": "areas"
+            }},
+            {"$project": {"lecturer": 1, "projectAreas": 1, "areas._id": 1, **{f"areas.{field}": 1 for field in PROJECT_AREA_FIELDS}}}
+        ]
+        areas_by_lecturer = {}
+        async for lpa in self.db["lecturer_project_areas"].aggregate(pipeline):
+            # Keep the first match per lecturer, like the find_one this replaces
+            if lpa["lecturer"] in areas_by_lecturer:
+                continue
+
+            # $lookup returns areas in collection order; restore the lecturer's own ordering
+            areas_by_id = {pa["_id"]: pa for pa in lpa["areas"]}
+            areas_by_lecturer[lpa["lecturer"]] = [
+                areas_by_id[pa_id]
+                for pa_id in lpa.get("projectAreas") or []
+                if not isinstance(pa_id, list) and pa_id in areas_by_id
+            ]
 
+        # Documents come straight from the database, so the response models are
+        # built with model_construct to skip per-field validation
         detailed_supervisors = []
         for supervisor in supervisors:
             # Get lecturer details (supervisor already contains lecturer info)
             lecturer_id = supervisor["lecturer_id"]
-            lecturer = await self.db["lecturers"].find_one({"_id": lecturer_id})
+            lecturer = lecturers_by_id.get(lecturer_id)
 
             # Get lecturer's project areas for this academic year
-            lpa = await self.db["lecturer_project_areas"].find_one({
-                "lecturer": lecturer_id,
-                "academicYear": ObjectId(academic_year_id)
-            })
-
-            project_areas = []
-            if lpa and lpa.get("projectAreas"):
-                for pa_id in lpa["projectAreas"]:
-                    pa = await self.db["project_areas"].find_one({"_id": pa_id})
-                    if pa:
-                        project_areas.append({
-                            "project_area_id": str(pa["_id"]),
-                            "title": pa.get("title", ""),
-                            "description": pa.get("description", ""),
-                            "image": pa.get("image", "")
-                        })
-
-            detailed_supervisor = {
-                "supervisor": {
-                    "supervisor_id": str(supervisor["_id"]),
-                    "academic_id": supervisor.get("academic_id", ""),
-                    "max_students": supervisor.get("max_students"),
-                    "project_student_count": supervisor.get("project_student_count", 0),
-                    "createdAt": supervisor.get("createdAt"),
-                    "updatedAt": supervisor.get("updatedAt")
-                },
-                "lecturer": {
-                    "lecturer_id": str(lecturer["_id"]) if lecturer else None,
-                    "name": lecturer.get("name", "") if lecturer else None,
-                    "email": lecturer.get("email", "") if lecturer else None,
-                    "phone": lecturer.get("phone", "") if lecturer else None,
-                    "department": lecturer.get("department", "") if lecturer else None,
-                    "title": lecturer.get("title", "") if lecturer else None,
-                    "specialization": lecturer.get("specialization", "") if lecturer else None,
-                    "academic_id": lecturer.get("academicId", "") if lecturer else None
-                } if lecturer else None,
-                "academic_year": {
-                    "academic_year_id": str(academic_year["_id"]) if academic_year else None,
-                    "title": academic_year.get("title", "") if academic_year else None,
-                    "status": academic_year.get("status", "") if academic_year else None,
-                    "terms": academic_year.get("terms", 0) if academic_year else None,
-                    "current_term": academic_year.get("currentTerm", 0) if academic_year else None
-                } if academic_year else None,
-                "project_areas": project_areas
-            }
-            detailed_supervisors.append(detailed_supervisor)
+            project_areas = [
+                ProjectAreaInfo.model_construct(
+                    project_area_id=str(pa["_id"]),
+                    title=pa.get("title", ""),
+                    description=pa.get("description", ""),
+                    image=pa.get("image", "")
+                )
+                for pa in areas_by_lecturer.get(lecturer_id, [])
+            ]
+
+            detailed_supervisors.append(SupervisorDetail.model_construct(
+                supervisor=SupervisorDetailInfo.model_construct(
+                    supervisor_id=str(supervisor["_id"]),
+                    academic_id=supervisor.get("academic_id", ""),
+                    max_students=supervisor.get("max_students"),
+                    project_student_count=supervisor.get("project_student_count", 0),
+                    createdAt=supervisor.get("createdAt"),
+                    updatedAt=supervisor.get("updatedAt")
+                ),
+                lecturer=LecturerDetailInfo.model_construct(
+                    lecturer_id=str(lecturer["_id"]),
+                    name=_full_name(lecturer),
+                    email=lecturer.get("email", ""),
+                    phone=lecturer.get("phone", ""),
+                    department=lecturer.get("department", ""),
+                    title=lecturer.get("title", ""),
+                    specialization=lecturer.get("specialization", ""),
+                    academic_id=lecturer.get("academicId", "")
+                ) if lecturer else None,
+                academic_year=academic_year_info,
+                project_areas=project_areas
+            ))
 
         return detailed_supervisors
 
@@ -463,33 +649,80 @@ class SupervisorController:
         Get supervisor details for a specific student by their academic ID
         """
 
-        #  Find the student by academicId
-        student = await self.db["students"].find_one({"academicId": student_id})
-        if not student:
+        #  Resolve the student, their most recent FYP, its supervisor and lecturer
+        #  and the project area in one aggregation
+        pipeline = [
+            {"$match": {"academicId": student_id}},
+            {"$limit": 1},
+            {"$project": STUDENT_FIELDS},
+            # FYPs reference students by their string id
+            {"$lookup": {
+                "from": "fyps",
+                "let": {"sid": {"$toString": "$_id"}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$student", "$$sid"]}}},
+                    {"$sort": {"createdAt": -1}},
+                    {"$limit": 1},
+                    {"$project": FYP_FIELDS}
+                ],
+                "as": "fyp"
+            }},
+            {"$unwind": {"path": "$fyp", "preserveNullAndEmptyArrays": True}},
+            {"$lookup": {
+                "from": "supervisors",
+                "let": {"sup": {"$convert": {"input": "$fyp.supervisor", "to": "objectId", "onError": None, "onNull": None}}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$sup"]}}},
+                    {"$project": SUPERVISOR_COUNT_FIELDS}
+                ],
+                "as": "supervisor"
+            }},
+            {"$unwind": {"path": "$supervisor", "preserveNullAndEmptyArrays": True}},
+            {"$lookup": {
+                "from": "lecturers",
+                "localField": "supervisor.lecturer_id",
+                "foreignField": "_id",
+                "as": "lecturer"
+            }},
+            {"$unwind": {"path": "$lecturer", "preserveNullAndEmptyArrays": True}},
+            {"$lookup": {
+                "from": "project_areas",
+                "let": {"pa": {"$convert": {"input": "$fyp.projectArea", "to": "objectId", "onError": None, "onNull": None}}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$pa"]}}},
+                    {"$project": PROJECT_AREA_FIELDS}
+                ],
+                "as": "project_area"
+            }},
+            {"$project": {
+                **STUDENT_FIELDS,
+                "fyp": 1,
+                "supervisor": 1,
+                "project_area": 1,
+                "lecturer._id": 1,
+                **{f"lecturer.{field}": 1 for field in LECTURER_FIELDS}
+            }}
+        ]
+        docs = await self.db["students"].aggregate(pipeline).to_list(1)
+        if not docs:
             raise HTTPException(status_code=404, detail=f"Student {student_id} not found")
+        student = docs[0]
 
-        #  Find the most recent FYP assignment for this student
-        fyp = await self.db["fyps"].find_one(
-            {"student": str(student["_id"])},
-            sort=[("createdAt", -1)]
-        )
-        
-        print(fyp)
+        fyp = student.get("fyp")
         if not fyp or not fyp.get("supervisor"):
             raise HTTPException(status_code=404, detail=f"No supervisor assigned to student {student_id}")
 
-        #  Get the supervisor document
-        supervisor_doc = await self.db["supervisors"].find_one({"_id": ObjectId(fyp["supervisor"])})
+        supervisor_doc = student.get("supervisor")
         if not supervisor_doc:
             raise HTTPException(status_code=404, detail="Supervisor record not found")
 
-        #  Ensure the linked lecturer exists
-        lecturer = await self.db["lecturers"].find_one({"_id": supervisor_doc["lecturer_id"]})
+        lecturer = student.get("lecturer")
         if not lecturer:
             raise HTTPException(status_code=404, detail="Lecturer not found for this supervisor")
 
-        #  Count total students supervised by this lecturer
-        total_students = await self.db["fyps"].count_documents({"supervisor": supervisor_doc["_id"]})
+        #  Total students supervised by this supervisor
+        await self._fill_student_counts([supervisor_doc])
+        total_students = supervisor_doc["project_student_count"]
 
         #  Get FYP details
         fyp_details = {
@@ -502,25 +735,24 @@ class SupervisorController:
 
         #  Get project area details (if available)
         project_area = None
-        if fyp.get("projectArea"):
-            pa = await self.db["project_areas"].find_one({"_id": ObjectId(fyp["projectArea"])})
-            if pa:
-                project_area = {
-                    "project_area_id": str(pa["_id"]),
-                    "title": pa.get("title", ""),
-                    "description": pa.get("description", ""),
-                    "image": pa.get("image", "")
-                }
+        if student["project_area"]:
+            pa = student["project_area"][0]
+            project_area = {
+                "project_area_id": str(pa["_id"]),
+                "title": pa.get("title", ""),
+                "description": pa.get("description", ""),
+                "image": pa.get("image", "")
+            }
 
         #  Format supervisor name
-        supervisor_name = f"{lecturer.get('surname', '')} {lecturer.get('otherNames', '')}".strip()
+        supervisor_name = _full_name(lecturer)
 
         #  Return structured response
         return {
             "student": {
                 "student_id": str(student["_id"]),
                 "academic_id": student.get("academicId", ""),
-                "student_name": f"{student.get('surname', '')} {student.get('otherNames', '')}".strip(),
+                "student_name": _full_name(student),
                 "email": student.get("email", ""),
                 "phone": student.get("phone", ""),
                 "program": str(student.get("program")) if student.get("program") else None,
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import List
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,6 +12,18 @@ class Settings(BaseSettings):
     VECTOR_STORES_PATH: str = "./vector_stores"
     MONGO_URL: str
     DB_NAME: str
+    MONGO_MAX_POOL_SIZE: int = 200
+    MONGO_MIN_POOL_SIZE: int = 20
+    MONGO_MAX_IDLE_TIME_MS: int = 60000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 3000
+    # zlib ships with Python; list zstd/snappy first once zstandard/python-snappy are installed
+    MONGO_COMPRESSORS: str = "zlib"
+    MONGO_ZLIB_COMPRESSION_LEVEL: int = 6
+    # Explicit lists let Starlette answer preflights without echoing arbitrary headers
+    CORS_ALLOW_METHODS: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    CORS_ALLOW_HEADERS: List[str] = ["authorization", "content-type", "x-requested-with", "accept", "api-key"]
+    CORS_MAX_AGE: int = 600
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_DAYS: int
@@ -19,4 +34,10 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file="./.env", extra="ignore")
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Build the settings once per process; usable as a FastAPI dependency"""
+    return Settings()
+
+
+settings = get_settings()
@@ -1,13 +1,62 @@
+import logging
+
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from app.core.config import settings
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
 
 MONGO_URL = settings.MONGO_URL
 
-mongo_client = AsyncIOMotorClient(MONGO_URL)
+mongo_client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+    waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    retryWrites=True,
+    compressors=settings.MONGO_COMPRESSORS,
+    zlibCompressionLevel=settings.MONGO_ZLIB_COMPRESSION_LEVEL,
+)
 
 db = mongo_client[settings.DB_NAME]
 
+# Indexes backing the hot query paths; create_index is a no-op when they already exist
+INDEXES = [
+    ("fyps", [("supervisor", 1)], {}),
+    ("fyps", [("supervisor", 1), ("checkin", 1)], {}),
+    ("fyps", [("student", 1), ("createdAt", -1)], {}),
+    ("fyps", [("checkin", 1)], {}),
+    ("groups", [("supervisor", 1), ("status", 1)], {}),
+    ("lecturer_project_areas", [("lecturer", 1), ("academicYear", 1)], {}),
+    ("supervisors", [("lecturer_id", 1)], {"unique": True}),
+    ("supervisors", [("createdAt", -1), ("_id", -1)], {}),
+    ("students", [("academicId", 1)], {"unique": True}),
+    ("academic_years", [("title", 1)], {}),
+    ("submissions", [("deliverable_id", 1)], {}),
+]
+
 async def get_db():
     yield db
 
+def log_pool_options():
+    pool = mongo_client.options.pool_options
+    logger.info(
+        "MongoDB pool: maxPoolSize=%s minPoolSize=%s maxIdleTimeMS=%s compressors=%s topology=%s",
+        pool.max_pool_size, pool.min_pool_size, settings.MONGO_MAX_IDLE_TIME_MS,
+        settings.MONGO_COMPRESSORS, mongo_client.topology_description.topology_type_name,
+    )
+
+async def init_indexes():
+    """Build INDEXES; a unique index that cannot be built stops startup, since writes rely on it"""
+    for collection, keys, options in INDEXES:
+        try:
+            await db[collection].create_index(keys, **options)
+        except Exception as e:
+            if options.get("unique"):
+                logger.error("Could not create unique index %s on %s: %s", keys, collection, e)
+                raise
+            logger.warning("Could not create index %s on %s: %s", keys, collection, e)
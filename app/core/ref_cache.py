@@ -0,0 +1,50 @@
+from typing import Any, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.cache import TTLCache
+
+# Reference collections change rarely, so lookups are shared across requests for a few minutes
+_academic_years = TTLCache(maxsize=512, ttl=300)
+_academic_years_by_title = TTLCache(maxsize=512, ttl=300)
+_checkins_by_academic_year = TTLCache(maxsize=512, ttl=300)
+
+
+async def _cached_find_one(cache: TTLCache, key: Any, collection, query: dict) -> Optional[dict]:
+    doc = cache.get(key)
+    if doc is None:
+        doc = await collection.find_one(query)
+        if doc:
+            cache.set(key, doc)
+    return doc
+
+
+async def get_academic_year(db: AsyncIOMotorDatabase, academic_year_id: str):
+    return await _cached_find_one(
+        _academic_years, academic_year_id, db["academic_years"], {"_id": ObjectId(academic_year_id)}
+    )
+
+
+async def get_academic_year_by_title(db: AsyncIOMotorDatabase, title: str):
+    return await _cached_find_one(
+        _academic_years_by_title, title, db["academic_years"], {"title": title}
+    )
+
+
+async def get_checkin_by_academic_year(db: AsyncIOMotorDatabase, academic_year):
+    """Look up the fypcheckin of an academic year, matching `academic_year` as stored (ObjectId or string)"""
+    return await _cached_find_one(
+        _checkins_by_academic_year, academic_year, db["fypcheckins"], {"academicYear": academic_year}
+    )
+
+
+def clear_academic_years():
+    """Drop cached academic years after one is changed"""
+    _academic_years.clear()
+    _academic_years_by_title.clear()
+
+
+def clear_checkins():
+    """Drop cached checkins after one is changed"""
+    _checkins_by_academic_year.clear()
@@ -0,0 +1,7 @@
+from fastapi import responses
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel) -> responses.Response:
+    """Serialize a response model as is, skipping FastAPI's response validation and jsonable_encoder"""
+    return responses.ORJSONResponse(model.model_dump(mode="json", by_alias=True))
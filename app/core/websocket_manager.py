@@ -1,79 +1,227 @@
-from typing import Dict, List, Set
-import json
+from typing import Deque, Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
+import sys
 import asyncio
 from fastapi import WebSocket, WebSocketDisconnect
 from datetime import datetime
 import logging
 
+import orjson
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Frames buffered per connection before a client is treated as too slow and dropped
+OUTBOUND_QUEUE_SIZE = 1024
+# Frames already waiting when the writer wakes are sent together, up to this many per batch
+MAX_BATCH_FRAMES = 128
+# Recipients queued between event loop yields during a group broadcast
+BROADCAST_BATCH_SIZE = 50
+
+# Connection confirmation frame, serialized once with only the timestamp left to fill in
+_CONNECTION_ESTABLISHED = '{"type":"connection_established","message":"Connected to chat server","timestamp":"%s"}'
+
+# Student ids per supervisor, kept briefly so a burst of broadcasts hits the database once
+_supervisor_students = TTLCache(maxsize=1024, ttl=5)
+
+
+def _dumps(message: dict) -> str:
+    """Serialize a websocket message to compact JSON text, stringifying ObjectIds and datetimes"""
+    return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+@dataclass(slots=True)
+class Connection:
+    """A connected user's socket, profile and outbound frames"""
+    websocket: WebSocket
+    info: dict
+    # Outbound frames, drained by the writer task whenever the signal is set
+    outbox: Deque[str] = field(default_factory=deque)
+    signal: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: Optional[asyncio.Task] = None
+    # Whether the client asked for queued frames to be coalesced into batch frames
+    batch: bool = False
+
+
 class ConnectionManager:
+    """Tracks the sockets of this worker process only; running several workers needs
+    an external pub/sub layer (e.g. Redis) to reach users connected elsewhere"""
+
     def __init__(self):
         # Store active connections by user_id
-        self.active_connections: Dict[str, WebSocket] = {}
-        # Store user info for each connection
-        self.user_info: Dict[str, dict] = {}
+        self.connections: Dict[str, Connection] = {}
         # Store group memberships for group messaging
         self.group_members: Dict[str, Set[str]] = {}
+        # Groups of each user, so disconnect only touches the groups the user is in
+        self.user_groups: Dict[str, Set[str]] = {}
+        # Users to drop once the current fan-out is done, so callers iterating groups never see them mutate
+        self._pending_disconnect: Set[str] = set()
 
-    async def connect(self, websocket: WebSocket, user_id: str, user_info: dict):
-        """Accept a new WebSocket connection and store user info"""
+    async def connect(self, websocket: WebSocket, user_id: str, user_info: dict, batch: bool = False):
+        """Accept a new WebSocket connection and store user info; `batch` opts the client into batch frames"""
         await websocket.accept()
-        self.active_connections[user_id] = websocket
-        self.user_info[user_id] = user_info
+        # Interned ids hash once and compare by identity in every dict and set below
+        user_id = sys.intern(user_id)
+        previous = self.connections.get(user_id)
+        if previous is not None and previous.writer is not None:
+            # The user reconnected; stop writing to the old socket
+            previous.writer.cancel()
+        connection = Connection(websocket=websocket, info=user_info, batch=batch)
+        connection.writer = asyncio.create_task(self._writer(user_id, connection))
+        self.connections[user_id] = connection
         
-        logger.info(f"User {user_id} connected. Total connections: {len(self.active_connections)}")
+        logger.info(f"User {user_id} connected. Total connections: {len(self.connections)}")
         
         # Send connection confirmation
-        await self.send_personal_message({
-            "type": "connection_established",
-            "message": "Connected to chat server",
-            "timestamp": datetime.utcnow().isoformat()
-        }, user_id)
+        self._send_prepared(_CONNECTION_ESTABLISHED % datetime.utcnow().isoformat(), user_id)
 
     def disconnect(self, user_id: str):
         """Remove a WebSocket connection"""
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-        if user_id in self.user_info:
-            del self.user_info[user_id]
+        connection = self.connections.pop(user_id, None)
+        if connection is not None and connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
         
-        # Remove from all groups
-        for group_id, members in self.group_members.items():
-            members.discard(user_id)
-            if not members:  # Remove empty groups
-                del self.group_members[group_id]
+        # Remove from all of the user's groups
+        for group_id in self.user_groups.pop(user_id, ()):
+            members = self.group_members.get(group_id)
+            if members is not None:
+                members.discard(user_id)
+                if not members:  # Remove empty groups
+                    del self.group_members[group_id]
         
-        logger.info(f"User {user_id} disconnected. Total connections: {len(self.active_connections)}")
+        logger.info(f"User {user_id} disconnected. Total connections: {len(self.connections)}")
 
     async def send_personal_message(self, message: dict, user_id: str):
         """Send a message to a specific user"""
-        if user_id in self.active_connections:
-            try:
-                await self.active_connections[user_id].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message to {user_id}: {e}")
-                # Remove the connection if it's broken
+        if user_id in self.connections:
+            if not self._send_prepared(_dumps(message), user_id):
+                # Drop the connection if it can't keep up, after the caller's loop has moved on
+                if not self._pending_disconnect:
+                    asyncio.get_running_loop().call_soon(self._flush_pending_disconnects)
+                self._pending_disconnect.add(user_id)
+
+    def _flush_pending_disconnects(self):
+        """Disconnect every user whose send failed during a fan-out"""
+        pending, self._pending_disconnect = self._pending_disconnect, set()
+        for user_id in pending:
+            self.disconnect(user_id)
+
+    def _send_prepared(self, data: str, user_id: str) -> bool:
+        """Queue an already serialized message for a user, returning False if their queue is full"""
+        connection = self.connections.get(user_id)
+        if connection is None:
+            return True
+        if len(connection.outbox) >= OUTBOUND_QUEUE_SIZE:
+            logger.error("Outbound queue full for %s, dropping connection", user_id)
+            return False
+        connection.outbox.append(data)
+        connection.signal.set()
+        return True
+
+    async def _writer(self, user_id: str, connection: Connection):
+        """Write queued frames to one connection so slow clients never block the sender.
+
+        Frames are sent one by one unless the client opted into batching at connect.
+        For those clients a lone frame is still sent unchanged, but frames already
+        waiting are coalesced into one `{"type": "batch", "messages": [...]}` frame,
+        which they unpack and handle message by message.
+        """
+        websocket, outbox, signal = connection.websocket, connection.outbox, connection.signal
+        try:
+            while True:
+                await signal.wait()
+                signal.clear()
+                if not connection.batch:
+                    while outbox:
+                        await websocket.send_text(outbox.popleft())
+                    continue
+                while outbox:
+                    batch = [outbox.popleft() for _ in range(min(len(outbox), MAX_BATCH_FRAMES))]
+                    if len(batch) == 1:
+                        await websocket.send_text(batch[0])
+                    else:
+                        await websocket.send_text('{"type":"batch","messages":[' + ",".join(batch) + "]}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to {user_id}: {e}")
+            # Remove the connection if it's broken, unless the user has already reconnected
+            if self.connections.get(user_id) is connection:
                 self.disconnect(user_id)
 
     async def send_group_message(self, message: dict, group_id: str, sender_id: str):
         """Send a message to all members of a group except the sender"""
-        if group_id in self.group_members:
-            for user_id in self.group_members[group_id]:
-                if user_id != sender_id:  # Don't send to sender
-                    await self.send_personal_message(message, user_id)
+        # Snapshot the members: disconnects during the fan-out mutate the live set
+        targets = tuple(
+            user_id for user_id in self.group_members.get(group_id, ())
+            if user_id != sender_id  # Don't send to sender
+        )
+        if not targets:
+            return
+
+        await self._fan_out(_dumps(message), targets)
 
-    async def broadcast_to_supervisor_students(self, message: dict, supervisor_id: str, sender_id: str):
+    async def _fan_out(self, payload: str, targets: tuple):
+        """Queue one serialized frame for each target user"""
+        # Each connection's writer sends concurrently; here we only queue the frame,
+        # yielding between chunks so large groups don't stall other requests
+        for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            for user_id in targets[start:start + BROADCAST_BATCH_SIZE]:
+                if not self._send_prepared(payload, user_id):
+                    self._pending_disconnect.add(user_id)
+        self._flush_pending_disconnects()
+
+    async def broadcast_to_supervisor_students(self, message: dict, supervisor_id: str, sender_id: str, db: AsyncIOMotorDatabase):
         """Send a message to all students supervised by a specific supervisor"""
-        # This will be implemented with database lookup
-        # For now, we'll use a placeholder
-        pass
+        student_ids = await self._get_supervisor_student_ids(db, supervisor_id)
+        targets = tuple(
+            user_id for user_id in student_ids
+            if user_id != sender_id and user_id in self.connections
+        )
+        if targets:
+            await self._fan_out(_dumps(message), targets)
+
+    async def _get_supervisor_student_ids(self, db: AsyncIOMotorDatabase, supervisor_id: str) -> Set[str]:
+        """Ids of the students on fyps of a supervisor, given its own id or its lecturer's id"""
+        student_ids = _supervisor_students.get(supervisor_id)
+        if student_ids is not None:
+            return student_ids
+
+        try:
+            oid = ObjectId(supervisor_id)
+        except (InvalidId, TypeError):
+            return set()
+
+        # fyps reference a supervisor by its own _id or by its lecturer's _id
+        refs = [oid]
+        supervisor = await db["supervisors"].find_one(
+            {"$or": [{"_id": oid}, {"lecturer_id": oid}]}, {"lecturer_id": 1}
+        )
+        if supervisor:
+            refs = [ref for ref in (supervisor["_id"], supervisor.get("lecturer_id")) if ref]
+
+        student_ids = {
+            str(fyp["student"])
+            async for fyp in db["fyps"].find({"supervisor": {"$in": refs}}, {"student": 1, "_id": 0})
+            if fyp.get("student")
+        }
+        _supervisor_students.set(supervisor_id, student_ids)
+        return student_ids
 
     def add_user_to_group(self, user_id: str, group_id: str):
         """Add a user to a group for group messaging"""
+        user_id, group_id = sys.intern(user_id), sys.intern(group_id)
         if group_id not in self.group_members:
             self.group_members[group_id] = set()
         self.group_members[group_id].add(user_id)
+        self.user_groups.setdefault(user_id, set()).add(group_id)
 
     def remove_user_from_group(self, user_id: str, group_id: str):
         """Remove a user from a group"""
@@ -81,17 +229,21 @@ class ConnectionManager:
             self.group_members[group_id].discard(user_id)
             if not self.group_members[group_id]:  # Remove empty groups
                 del self.group_members[group_id]
+        if user_id in self.user_groups:
+            self.user_groups[user_id].discard(group_id)
+            if not self.user_groups[user_id]:
+                del self.user_groups[user_id]
 
     def get_connected_users(self) -> List[dict]:
         """Get list of all connected users"""
         return [
-            {"user_id": user_id, "user_info": info}
-            for user_id, info in self.user_info.items()
+            {"user_id": user_id, "user_info": connection.info}
+            for user_id, connection in self.connections.items()
         ]
 
     def is_user_connected(self, user_id: str) -> bool:
         """Check if a user is currently connected"""
-        return user_id in self.active_connections
+        return user_id in self.connections
 
 # Global connection manager instance
 manager = ConnectionManager()
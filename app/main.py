@@ -1,4 +1,7 @@
-from fastapi import FastAPI, responses
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.routes import (
@@ -41,8 +44,18 @@ from app.api.v1.routes import (
     websocket_chat,
 )
 from app.core.config import settings
+from app.core.database import init_indexes, log_pool_options
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_pool_options()
+    await init_indexes()
+    yield
+
+
+app = FastAPI(title=settings.PROJECT_TITLE, default_response_class=ORJSONResponse, lifespan=lifespan)
 
-app = FastAPI(title=settings.PROJECT_TITLE)
 
 origins = [
     "http://localhost:3000", 
@@ -54,47 +67,54 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
+)
+
+# Routers served under the API version prefix, in registration order
+ROUTERS = (
+    general.router,
+    models.router,
+    academic_years.router,
+    database.router,
+    students.router,
+    student_interests.router,
+    auth.router,
+    # logins.router,
+    activity_logs.router,
+    recent_activities.router,
+    reminders.router,
+    fypcheckins.router,
+    project_areas.router,
+    fyps.router,
+    programs.router,
+    projects.router,
+    deliverables.router,
+    submissions.router,
+    groups.router,
+    lecturer_project_areas.router,
+    lecturers.router,
+    complaints.router,
+    supervisors.router,
+    communications.router,
+    enhanced_supervisor_interests.router,
+    coordinator_stats.router,
+    coordinator_project_areas.router,
+    coordinator_logs.router,
+    defense_schedules.router,
+    supervisor_stats.router,
+    supervisor_reminders.router,
+    supervisor_students.router,
+    supervisor_deliverables.router,
+    supervisor_submissions.router,
+    announcements.router,
+    websocket_chat.router,
 )
 
 app.include_router(health.router)
-app.include_router(general.router, prefix=settings.API_V1_STR)
-app.include_router(models.router, prefix=settings.API_V1_STR)
-app.include_router(academic_years.router, prefix=settings.API_V1_STR)
-app.include_router(database.router, prefix=settings.API_V1_STR)
-app.include_router(students.router, prefix=settings.API_V1_STR)
-app.include_router(student_interests.router, prefix=settings.API_V1_STR)
-app.include_router(auth.router, prefix=settings.API_V1_STR)
-# app.include_router(logins.router, prefix=settings.API_V1_STR)
-app.include_router(activity_logs.router, prefix=settings.API_V1_STR)
-app.include_router(recent_activities.router, prefix=settings.API_V1_STR)
-app.include_router(reminders.router, prefix=settings.API_V1_STR)
-app.include_router(fypcheckins.router, prefix=settings.API_V1_STR)
-app.include_router(project_areas.router, prefix=settings.API_V1_STR)
-app.include_router(fyps.router, prefix=settings.API_V1_STR)
-app.include_router(programs.router, prefix=settings.API_V1_STR)
-app.include_router(projects.router, prefix=settings.API_V1_STR)
-app.include_router(deliverables.router, prefix=settings.API_V1_STR)
-app.include_router(submissions.router, prefix=settings.API_V1_STR)
-app.include_router(groups.router, prefix=settings.API_V1_STR)
-app.include_router(lecturer_project_areas.router, prefix=settings.API_V1_STR)
-app.include_router(lecturers.router, prefix=settings.API_V1_STR)
-app.include_router(complaints.router, prefix=settings.API_V1_STR)
-app.include_router(supervisors.router, prefix=settings.API_V1_STR)
-app.include_router(communications.router, prefix=settings.API_V1_STR)
-app.include_router(enhanced_supervisor_interests.router, prefix=settings.API_V1_STR)
-app.include_router(coordinator_stats.router, prefix=settings.API_V1_STR)
-app.include_router(coordinator_project_areas.router, prefix=settings.API_V1_STR)
-app.include_router(coordinator_logs.router, prefix=settings.API_V1_STR)
-app.include_router(defense_schedules.router, prefix=settings.API_V1_STR)
-app.include_router(supervisor_stats.router, prefix=settings.API_V1_STR)
-app.include_router(supervisor_reminders.router, prefix=settings.API_V1_STR)
-app.include_router(supervisor_students.router, prefix=settings.API_V1_STR)
-app.include_router(supervisor_deliverables.router, prefix=settings.API_V1_STR)
-app.include_router(supervisor_submissions.router, prefix=settings.API_V1_STR)
-app.include_router(announcements.router, prefix=settings.API_V1_STR)
-app.include_router(websocket_chat.router, prefix=settings.API_V1_STR)
+for router in ROUTERS:
+    app.include_router(router, prefix=settings.API_V1_STR)
 
 
 @app.get("/", include_in_schema=False)
@@ -1,16 +1,11 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["AcademicYearPublic"]
-    next_cursor: Optional[str] = None
-
-
-class AcademicYearCreate(BaseModel):
+class AcademicYearCreate(InputObj):
     year: str
     createdBy: PyObjectId
     terms: int = 2
@@ -19,7 +14,7 @@ class AcademicYearCreate(BaseModel):
     deleted: bool = False
 
 
-class AcademicYearUpdate(BaseModel):
+class AcademicYearUpdate(InputObj):
     year: Optional[str] = None
     terms: Optional[int] = None
     status: Optional[str] = None
@@ -30,9 +25,14 @@ class AcademicYearUpdate(BaseModel):
 class AcademicYearPublic(Obj):
     year: str
     createdBy: PyObjectId
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
     deleted: bool = False
     terms: int = 2
     status: str = "INACTIVE"
-    currentTerm: int = 1
\ No newline at end of file
+    currentTerm: int = 1
+
+
+class Page(BaseModel):
+    items: List[AcademicYearPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Any, List
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict
 
 class ActorInfo(BaseModel):
     id: str
@@ -13,8 +13,8 @@ class Detail(BaseModel):
 class ActivityPublic(BaseModel):
     action: str
     details: Optional[Detail]
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: Optional[datetime] = None
 
 class Page(BaseModel):
     items: List[ActivityPublic]
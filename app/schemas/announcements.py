@@ -3,15 +3,10 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from pydantic import BaseModel, Field, ConfigDict
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List[AnnouncementPublic]
-    next_cursor: Optional[str] = None
-
-
-class AnnouncementCreate(BaseModel):
+class AnnouncementCreate(InputObj):
     subject: str
     content: str
     recipient_ids: Optional[List[PyObjectId]] = None
@@ -21,7 +16,7 @@ class AnnouncementCreate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class AnnouncementUpdate(BaseModel):
+class AnnouncementUpdate(InputObj):
     subject: Optional[str] = None
     content: Optional[str] = None
     priority: Optional[str] = None
@@ -43,3 +38,7 @@ class AnnouncementPublic(Obj):
     
     model_config = ConfigDict(populate_by_name=True)
 
+
+class Page(BaseModel):
+    items: List[AnnouncementPublic]
+    next_cursor: Optional[str] = None
@@ -1,8 +1,25 @@
-from typing import Annotated
-from pydantic import BeforeValidator, BaseModel, Field
+from typing import Annotated, Any, Iterable, List, Optional
+from pydantic import BeforeValidator, BaseModel, ConfigDict, Field
 
 PyObjectId = Annotated[str, BeforeValidator(str)]
 
 
+def oid_str(value: Any) -> Optional[str]:
+    """A stored reference as PyObjectId validation returns it"""
+    return None if value is None else str(value)
+
+
+def oid_strs(values: Optional[Iterable[Any]]) -> Optional[List[str]]:
+    return None if values is None else [str(value) for value in values]
+
+
 class Obj(BaseModel):
-    id: PyObjectId = Field(validation_alias="_id")
\ No newline at end of file
+    # Validators are built on first use instead of at import; responses are never mutated
+    model_config = ConfigDict(defer_build=True, frozen=True, populate_by_name=True, from_attributes=True)
+
+    id: PyObjectId = Field(validation_alias="_id")
+
+
+class InputObj(BaseModel):
+    # Request bodies are read once and never mutated
+    model_config = ConfigDict(defer_build=True, frozen=True)
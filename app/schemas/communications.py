@@ -1,13 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
-
-
-class Page(BaseModel):
-    items: List["CommunicationPublic"]
-    next_cursor: Optional[str] = None
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
 class Participant(BaseModel):
@@ -31,14 +26,14 @@ class Reply(BaseModel):
     updatedAt: Optional[datetime] = None
 
 
-class CommunicationCreate(BaseModel):
+class CommunicationCreate(InputObj):
     sender: Participant
     recipients: List[Recipient]
     text: str
     replies: List[Reply] = []
 
 
-class CommunicationUpdate(BaseModel):
+class CommunicationUpdate(InputObj):
     sender: Optional[Participant] = None
     recipients: Optional[List[Recipient]] = None
     text: Optional[str] = None
@@ -50,20 +45,25 @@ class CommunicationPublic(Obj):
     recipients: List[Recipient]
     text: str
     replies: List[Reply] = []
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
-class SendMessageRequest(BaseModel):
+class SendMessageRequest(InputObj):
     recipients: List[Recipient]
     text: str
 
 
-class ReplyMessageRequest(BaseModel):
+class ReplyMessageRequest(InputObj):
     text: str
     sender: Participant
 
 
-class GetConversationsRequest(BaseModel):
+class GetConversationsRequest(InputObj):
     participant_id: str
-    user_type: str
\ No newline at end of file
+    user_type: str
+
+
+class Page(BaseModel):
+    items: List[CommunicationPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,16 +1,11 @@
 from datetime import datetime
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["ComplaintPublic"]
-    next_cursor: Optional[str] = None
-
-
-class ComplaintCreate(BaseModel):
+class ComplaintCreate(InputObj):
     subject: str
     complaint: str
     reference: Optional[str] = None
@@ -25,7 +20,7 @@ class ComplaintCreate(BaseModel):
     admin: Optional[PyObjectId] = None
 
 
-class ComplaintUpdate(BaseModel):
+class ComplaintUpdate(InputObj):
     subject: Optional[str] = None
     complaint: Optional[str] = None
     reference: Optional[str] = None
@@ -53,8 +48,8 @@ class ComplaintPublic(Obj):
     deleted: bool = False
     feedbacks: List[Dict] = []
     admin: Optional[PyObjectId] = None
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class ComplaintAction(BaseModel):
@@ -70,4 +65,9 @@ class ComplaintFeedback(BaseModel):
     message: str
     provided_by: PyObjectId
     provided_at: datetime
-    rating: Optional[int] = None
\ No newline at end of file
+    rating: Optional[int] = None
+
+
+class Page(BaseModel):
+    items: List[ComplaintPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,16 +1,16 @@
 from datetime import datetime, date, time
 from typing import Optional, List
 from pydantic import BaseModel, Field
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class DefensePanelCreate(BaseModel):
+class DefensePanelCreate(InputObj):
     name: str
     lecturer_ids: List[PyObjectId]
     description: Optional[str] = None
 
 
-class DefensePanelUpdate(BaseModel):
+class DefensePanelUpdate(InputObj):
     name: Optional[str] = None
     lecturer_ids: Optional[List[PyObjectId]] = None
     description: Optional[str] = None
@@ -23,10 +23,6 @@ class DefensePanelPublic(Obj):
     description: Optional[str] = None
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
-    
-    class Config:
-        populate_by_name = True
-        from_attributes = True
 
 
 class TimeSlot(BaseModel):
@@ -36,7 +32,7 @@ class TimeSlot(BaseModel):
     end_time: str
 
 
-class DefenseScheduleCreate(BaseModel):
+class DefenseScheduleCreate(InputObj):
     panel_id: PyObjectId
     student_ids: Optional[List[PyObjectId]] = []
     group_ids: Optional[List[PyObjectId]] = []
@@ -47,7 +43,7 @@ class DefenseScheduleCreate(BaseModel):
     notes: Optional[str] = None
 
 
-class DefenseScheduleUpdate(BaseModel):
+class DefenseScheduleUpdate(InputObj):
     panel_id: Optional[PyObjectId] = None
     student_ids: Optional[List[PyObjectId]] = None
     group_ids: Optional[List[PyObjectId]] = None
@@ -84,10 +80,6 @@ class DefenseSchedulePublic(Obj):
     created_by: Optional[str] = None
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
-    
-    class Config:
-        populate_by_name = True
-        from_attributes = True
 
 
 class Page(BaseModel):
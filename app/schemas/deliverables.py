@@ -2,15 +2,11 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 from app.schemas.submissions import SubmissionPublic
 
 
-class Page(BaseModel):
-    items: List["DeliverablePublic"]
-    next_cursor: Optional[str] = None
-
-class DeliverableCreate(BaseModel):
+class DeliverableCreate(InputObj):
     title: str
     start_date: datetime
     end_date: datetime
@@ -18,7 +14,7 @@ class DeliverableCreate(BaseModel):
     instructions: Optional[str] = None
     file_path: Optional[str] = None
 
-class DeliverableUpdate(BaseModel):
+class DeliverableUpdate(InputObj):
     title: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
@@ -42,3 +38,8 @@ class DeliverablePublic(Obj):
     total_submissions: int = 0
     created_at: Optional[datetime] = Field(default=None, validation_alias="createdAt")
     updated_at: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
+
+
+class Page(BaseModel):
+    items: List[DeliverablePublic]
+    next_cursor: Optional[str] = None
@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import List, Optional, Dict
+from typing_extensions import TypedDict
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
 class SupervisorInfo(BaseModel):
@@ -43,12 +44,12 @@ class SupervisorInterestProfile(BaseModel):
     total_interested_students: int
 
 
-class AddSupervisorInterestRequest(BaseModel):
+class AddSupervisorInterestRequest(InputObj):
     project_area_id: PyObjectId
     academic_year_id: PyObjectId
 
 
-class RemoveSupervisorInterestRequest(BaseModel):
+class RemoveSupervisorInterestRequest(InputObj):
     project_area_id: PyObjectId
     academic_year_id: PyObjectId
 
@@ -74,19 +75,32 @@ class MatchingStudent(BaseModel):
     project_area: MatchingStudentProjectArea
     student_preference: MatchingStudentPreference
     match_score: float
-    interest_created_at: Optional[datetime] = Field(validation_alias="interest_created_at", default=None)
+    interest_created_at: Optional[datetime] = None
 
 
 class SupervisorMatchingStudentsResponse(BaseModel):
     items: List[MatchingStudent]
 
 
+class PopularArea(TypedDict):
+    project_area_id: str
+    title: str
+    supervisor_count: int
+
+
+class CapacityUtilization(TypedDict):
+    current_students: int
+    max_students: int
+    utilization_percentage: float
+    available_slots: int
+
+
 class SupervisorInterestAnalytics(BaseModel):
     total_supervisors: int
     supervisors_with_interests: int
     average_interests_per_supervisor: float
-    most_popular_areas_for_supervisors: List[Dict]
-    supervisor_capacity_utilization: Dict
+    most_popular_areas_for_supervisors: List[PopularArea]
+    supervisor_capacity_utilization: Dict[str, CapacityUtilization]
     matching_statistics: Dict
 
 
@@ -1,22 +1,17 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["FypCheckinPublic"]
-    next_cursor: Optional[str] = None
-
-
-class FypCheckinCreate(BaseModel):
+class FypCheckinCreate(InputObj):
     academicYear: PyObjectId
     checkin: bool = True
     active: bool = True
 
 
-class FypCheckinUpdate(BaseModel):
+class FypCheckinUpdate(InputObj):
     academicYear: Optional[PyObjectId] = None
     checkin: Optional[bool] = None
     active: Optional[bool] = None
@@ -26,5 +21,10 @@ class FypCheckinPublic(Obj):
     academicYear: PyObjectId
     checkin: bool
     active: bool
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
\ No newline at end of file
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class Page(BaseModel):
+    items: List[FypCheckinPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
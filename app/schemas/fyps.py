@@ -1,24 +1,19 @@
 from datetime import datetime
-from typing import Optional, List, Dict, Union
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 from app.schemas.project_areas import ProjectAreaPublic
 
 
-class Page(BaseModel):
-    items: List["FypPublic"]
-    next_cursor: Optional[str] = None
-
-
-class FypCreate(BaseModel):
+class FypCreate(InputObj):
     group: PyObjectId
     projectArea: PyObjectId
     title: str
     checkin: PyObjectId
 
 
-class FypUpdate(BaseModel):
+class FypUpdate(InputObj):
     group: Optional[PyObjectId] = None
     projectArea: Optional[PyObjectId] = None
     title: Optional[str] = None
@@ -26,14 +21,14 @@ class FypUpdate(BaseModel):
 
 
 class FypPublic(Obj):
-    group: Union[PyObjectId, str]
-    projectArea: Union[PyObjectId, str]
+    group: PyObjectId
+    projectArea: PyObjectId
     title: str
     progress_percentage: float = 0.0
-    checkin: Union[PyObjectId, str]
-    supervisor: Optional[Union[PyObjectId, str]] = None
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    checkin: PyObjectId
+    supervisor: Optional[PyObjectId] = None
+    createdAt: datetime
+    updatedAt: datetime
 
     
 class FypPublicWithProjectArea(Obj):
@@ -41,8 +36,8 @@ class FypPublicWithProjectArea(Obj):
     projectArea: ProjectAreaPublic
     checkin: PyObjectId
     supervisor: Optional[PyObjectId] = None
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class FypWithDetails(BaseModel):
@@ -65,7 +60,7 @@ class DeliverableProgress(BaseModel):
     status: str
 
 
-class SupervisorInfo(BaseModel):
+class DashboardSupervisorInfo(BaseModel):
     name: str
     academicId: Optional[str] = None
     areaOfInterest: Optional[str] = None
@@ -74,7 +69,7 @@ class SupervisorInfo(BaseModel):
     department: Optional[str] = None
 
 
-class ProjectAreaInfo(BaseModel):
+class DashboardProjectAreaInfo(BaseModel):
     title: str
     description: Optional[str] = None
     topic: Optional[str] = None
@@ -99,9 +94,14 @@ class CalendarInfo(BaseModel):
 
 
 class FypDashboard(BaseModel):
-    supervisor: SupervisorInfo
-    projectArea: ProjectAreaInfo
+    supervisor: DashboardSupervisorInfo
+    projectArea: DashboardProjectAreaInfo
     projectOverview: ProjectOverview
     projectProgress: List[DeliverableProgress]
     calendar: CalendarInfo
-    reminders: List[ReminderInfo]
\ No newline at end of file
+    reminders: List[ReminderInfo]
+
+
+class Page(BaseModel):
+    items: List[FypPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,24 +1,14 @@
-from enum import Enum
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
+from typing_extensions import TypedDict
 from pydantic import BaseModel
 
-class Provider(str, Enum):
-    openai = "openai"
-    groq = "groq"
-    quest = "quest"
+Provider = Literal["openai", "groq", "quest"]
 
-class Type(str, Enum):
-    text = "text"
-    audio = "audio"
-    image = "image"
+Type = Literal["text", "audio", "image"]
 
-class Role(str, Enum):
-    system = "system"
-    user = "user"
-    assistant = "assistant"
-    tool = "tool"
+Role = Literal["system", "user", "assistant", "tool"]
 
-class Messages(BaseModel):
+class Messages(TypedDict):
     role: Role
     content: str
 
@@ -1,22 +1,18 @@
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List
+from typing_extensions import TypedDict
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["GroupPublic"]
-    next_cursor: Optional[str] = None
-
-
-class GroupCreate(BaseModel):
+class GroupCreate(InputObj):
     name: str
     project_title: Optional[str] = None
     students: List[PyObjectId] = []
 
 
-class GroupUpdate(BaseModel):
+class GroupUpdate(InputObj):
     name: Optional[str] = None
     project_title: Optional[str] = None
 
@@ -37,22 +33,32 @@ class GroupPublic(Obj):
     student_count: int
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
-    
-    class Config:
-        populate_by_name = True
-        from_attributes = True
+
+
+class GroupStudent(TypedDict):
+    student_id: str
+    student_academicId: Optional[str]
+    student_name: str
+    student_email: Optional[str]
+    student_image: Optional[str]
+    student_programme: Optional[PyObjectId]
 
 
 class GroupWithStudents(BaseModel):
     group: GroupPublic
-    students: List[Dict] = []
+    students: List[GroupStudent] = []
     
     
-class GroupAssignmentRequest(BaseModel):
+class GroupAssignmentRequest(InputObj):
     group_ids: List[str]
     academic_year_id: str
     supervisor_id: PyObjectId
     
 class GroupAssignmentResponse(BaseModel):
     assigned_groups: List[str] = []
-    assignment_errors: List[str] = []
\ No newline at end of file
+    assignment_errors: List[str] = []
+
+
+class Page(BaseModel):
+    items: List[GroupPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,22 +1,18 @@
 from datetime import datetime
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from typing import Any, Optional, List, Dict
+from typing_extensions import TypedDict
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["LecturerProjectAreaPublic"]
-    next_cursor: Optional[str] = None
-
-
-class LecturerProjectAreaCreate(BaseModel):
+class LecturerProjectAreaCreate(InputObj):
     lecturer: PyObjectId
     projectAreas: List[PyObjectId]
     academicYear: PyObjectId
 
 
-class LecturerProjectAreaUpdate(BaseModel):
+class LecturerProjectAreaUpdate(InputObj):
     lecturer: Optional[PyObjectId] = None
     projectAreas: Optional[List[PyObjectId]] = None
     academicYear: Optional[PyObjectId] = None
@@ -26,12 +22,32 @@ class LecturerProjectAreaPublic(Obj):
     lecturer: PyObjectId
     projectAreas: List[PyObjectId]
     academicYear: PyObjectId
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class StudentDetails(TypedDict):
+    student_id: str
+    student_name: str
+    surname: Optional[str]
+    otherNames: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    student_image: Optional[str]
+    academicId: Optional[str]
+    program: Any
+    level: Any
+    type: Optional[str]
+    deleted: Optional[bool]
 
 
 class StudentInfoResponse(BaseModel):
-    student: Dict
+    student: StudentDetails
     supervisor: Optional[Dict] = None
     project_area: Optional[Dict] = None
-    fyp_details: Optional[Dict] = None
\ No newline at end of file
+    fyp_details: Optional[Dict] = None
+
+
+class Page(BaseModel):
+    items: List[LecturerProjectAreaPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,16 +1,11 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId, oid_strs
 
 
-class Page(BaseModel):
-    items: List["LecturerPublic"]
-    next_cursor: Optional[str] = None
-
-
-class LecturerCreate(BaseModel):
+class LecturerCreate(InputObj):
     image: Optional[str] = None
     title: Optional[str] = None
     surname: str
@@ -29,7 +24,7 @@ class LecturerCreate(BaseModel):
     projectAreas: List[PyObjectId] = []
 
 
-class LecturerUpdate(BaseModel):
+class LecturerUpdate(InputObj):
     image: Optional[str] = None
     title: Optional[str] = None
     surname: Optional[str] = None
@@ -67,5 +62,35 @@ class LecturerPublic(Obj):
     committees: List[str] = []
     deleted: bool = False
     projectAreas: List[PyObjectId] = []
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
\ No newline at end of file
+    createdAt: datetime
+    updatedAt: datetime
+
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "LecturerPublic":
+        """Build from a stored lecturer without validation, converting only what validation would"""
+        return cls.model_construct(
+            id=str(doc["_id"]),
+            image=doc.get("image"),
+            title=doc.get("title"),
+            surname=doc["surname"],
+            otherNames=doc.get("otherNames"),
+            academicId=doc["academicId"],
+            pin=doc["pin"],
+            position=doc.get("position"),
+            email=doc["email"],
+            phone=doc.get("phone"),
+            bio=doc.get("bio"),
+            officeHours=doc.get("officeHours"),
+            officeLocation=doc.get("officeLocation"),
+            department=doc.get("department"),
+            committees=doc.get("committees", []),
+            deleted=bool(doc.get("deleted", False)),
+            projectAreas=oid_strs(doc.get("projectAreas", [])),
+            createdAt=doc["createdAt"],
+            updatedAt=doc["updatedAt"],
+        )
+
+
+class Page(BaseModel):
+    items: List[LecturerPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
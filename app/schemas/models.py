@@ -2,24 +2,20 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel
 
-from app.schemas.base import Obj
+from app.schemas.base import Obj, InputObj
 from app.schemas.gateway import Provider, Type
 
-class Page(BaseModel):
-    items: List["ModelPublic"]
-    next_cursor: Optional[str] = None
-
 class LanguageModel(BaseModel):
     model: str
     url: Optional[str] = None
 
-class ModelCreate(BaseModel):
+class ModelCreate(InputObj):
     provider: Provider
     type: Type
     url: Optional[str] = None
     models: List[LanguageModel]
 
-class ModelUpdate(BaseModel):
+class ModelUpdate(InputObj):
     provider: Optional[Provider] = None
     type: Optional[Type] = None
     url: Optional[str] = None
@@ -31,4 +27,9 @@ class ModelPublic(Obj):
     url: str
     models: List[LanguageModel]
     created_at: datetime
-    updated_at: Optional[datetime] = None
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+
+
+class Page(BaseModel):
+    items: List[ModelPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -1,16 +1,11 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["ProgramPublic"]
-    next_cursor: Optional[str] = None
-
-
-class ProgramCreate(BaseModel):
+class ProgramCreate(InputObj):
     title: str
     tag: str
     description: str
@@ -18,7 +13,7 @@ class ProgramCreate(BaseModel):
     code: str
 
 
-class ProgramUpdate(BaseModel):
+class ProgramUpdate(InputObj):
     title: Optional[str] = None
     tag: Optional[str] = None
     description: Optional[str] = None
@@ -30,13 +25,32 @@ class ProgramPublic(Obj):
     tag: str
     description: str
     createdBy: PyObjectId
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
     code: str
 
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "ProgramPublic":
+        """Build from a stored program without validation, converting only what validation would"""
+        return cls.model_construct(
+            id=str(doc["_id"]),
+            title=doc["title"],
+            tag=doc["tag"],
+            description=doc["description"],
+            createdBy=str(doc["createdBy"]),
+            createdAt=doc["createdAt"],
+            updatedAt=doc["updatedAt"],
+            code=doc["code"],
+        )
+
 
 class StudentDashboardResponse(BaseModel):
     student_id: PyObjectId
     student_image: Optional[str] = None
     program: Optional[ProgramPublic] = None
-    progress_status: str
\ No newline at end of file
+    progress_status: str
+
+
+class Page(BaseModel):
+    items: List[ProgramPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
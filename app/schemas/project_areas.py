@@ -1,23 +1,18 @@
 from datetime import datetime
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["ProjectAreaPublic"]
-    next_cursor: Optional[str] = None
-
-
-class ProjectAreaCreate(BaseModel):
+class ProjectAreaCreate(InputObj):
     title: str
     description: str
     image: Optional[str] = None
     interested_staff: List[PyObjectId] = []
 
 
-class ProjectAreaUpdate(BaseModel):
+class ProjectAreaUpdate(InputObj):
     title: Optional[str] = None
     description: Optional[str] = None
     image: Optional[str] = None
@@ -30,8 +25,8 @@ class ProjectAreaPublic(Obj):
     image: Optional[str] = None
     interested_staff: List[PyObjectId] = []
     interested_staff_count: int = 0
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class ProjectAreaWithLecturers(BaseModel):
@@ -40,4 +35,9 @@ class ProjectAreaWithLecturers(BaseModel):
 
 
 class AllProjectAreasWithLecturers(BaseModel):
-    project_areas: List[ProjectAreaPublic]
\ No newline at end of file
+    project_areas: List[ProjectAreaPublic]
+
+
+class Page(BaseModel):
+    items: List[ProjectAreaPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
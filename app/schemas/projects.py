@@ -2,21 +2,16 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["ProjectPublic"]
-    next_cursor: Optional[str] = None
-    
-    
-class ProjectCreate(BaseModel):
+class ProjectCreate(InputObj):
     title: str
     description: str
     project_area_id: PyObjectId
     
     
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(InputObj):
     title: Optional[str] = None
     description: Optional[str] = None
     project_area_id: Optional[PyObjectId] = None
@@ -39,4 +34,9 @@ class ProjectWithDetails(BaseModel):
     
     
 class AllProjectsWithDetails(BaseModel):
-    projects: List[ProjectPublic]
\ No newline at end of file
+    projects: List[ProjectPublic]
+
+
+class Page(BaseModel):
+    items: List[ProjectPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
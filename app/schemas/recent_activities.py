@@ -2,22 +2,17 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
-class Page(BaseModel):
-    items: List["RecentActivityPublic"]
-    next_cursor: Optional[str] = None
-
-
-class RecentActivityCreate(BaseModel):
+class RecentActivityCreate(InputObj):
     timestamp: datetime
     user_id: PyObjectId
     user_name: str
     description: str
 
 
-class RecentActivityUpdate(BaseModel):
+class RecentActivityUpdate(InputObj):
     timestamp: Optional[datetime] = None
     user_id: Optional[PyObjectId] = None
     user_name: Optional[str] = None
@@ -30,4 +25,9 @@ class RecentActivityPublic(Obj):
     user_name: str
     description: str
     created_at: Optional[datetime] = Field(default=None, validation_alias="createdAt")
-    updated_at: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
\ No newline at end of file
+    updated_at: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
+
+
+class Page(BaseModel):
+    items: List[RecentActivityPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -2,20 +2,15 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj
+from app.schemas.base import Obj, InputObj
 
 
-class Page(BaseModel):
-    items: List["ReminderPublic"]
-    next_cursor: Optional[str] = None
-
-
-class ReminderCreate(BaseModel):
+class ReminderCreate(InputObj):
     title: str
     date_time: datetime
 
 
-class ReminderUpdate(BaseModel):
+class ReminderUpdate(InputObj):
     title: Optional[str] = None
     date_time: Optional[datetime] = None
 
@@ -24,4 +19,9 @@ class ReminderPublic(Obj):
     title: str
     date_time: datetime
     created_at: Optional[datetime] = Field(default=None, validation_alias="createdAt")
-    updated_at: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
\ No newline at end of file
+    updated_at: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
+
+
+class Page(BaseModel):
+    items: List[ReminderPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
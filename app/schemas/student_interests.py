@@ -1,9 +1,9 @@
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Union
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict
 from enum import Enum
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 from app.schemas.project_areas import ProjectAreaPublic
 
 
@@ -13,52 +13,33 @@ class InterestLevel(str, Enum):
     HIGH = "HIGH"
 
 
-class Page(BaseModel):
-    items: List["StudentInterestPublic"]
-    next_cursor: Optional[str] = None
-
-
 class PreferenceOption(BaseModel):
     option: int
     supervisor_id: str
     project_area_id: str
 
 class StudentPreferenceSchema(BaseModel):
-    student_id: Union[PyObjectId, str]
-    academic_year_id: Union[PyObjectId, str]
+    student_id: PyObjectId
+    academic_year_id: PyObjectId
     preferences: List[PreferenceOption]
     project_topic: str
 
 
-class StudentInterestCreate(BaseModel):
+class StudentInterestCreate(InputObj):
     student: PyObjectId
     academicYear: PyObjectId
-    projectAreas: List[PyObjectId]
+    projectAreas: List[PyObjectId] = Field(min_length=1, max_length=5)
     preference_rank: Optional[int] = Field(default=0, ge=0, le=10)
     interest_level: InterestLevel = InterestLevel.MEDIUM
     # notes: Optional[str] = Field(default="", max_length=500)
 
-    @validator('projectAreas')
-    def validate_project_areas(cls, v):
-        if not v:
-            raise ValueError('At least one project area must be specified')
-        if len(v) > 5:
-            raise ValueError('Cannot specify more than 5 project areas')
-        return v
-
 
-class StudentInterestUpdate(BaseModel):
-    projectAreas: Optional[List[PyObjectId]] = None
+class StudentInterestUpdate(InputObj):
+    projectAreas: Optional[List[PyObjectId]] = Field(default=None, max_length=5)
     preference_rank: Optional[int] = Field(default=None, ge=0, le=10)
     interest_level: Optional[InterestLevel] = None
     notes: Optional[str] = Field(default=None, max_length=500)
 
-    @validator('projectAreas')
-    def validate_project_areas(cls, v):
-        if v is not None and len(v) > 5:
-            raise ValueError('Cannot specify more than 5 project areas')
-        return v
-
 
 class StudentInterestPublic(Obj):
     student: PyObjectId
@@ -68,8 +49,8 @@ class StudentInterestPublic(Obj):
     preference_rank: int = 0
     interest_level: InterestLevel = InterestLevel.MEDIUM
     notes: str = ""
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class StudentInterestWithDetails(BaseModel):
@@ -78,7 +59,7 @@ class StudentInterestWithDetails(BaseModel):
     project_area_details: List[Dict]
     academic_year_details: Dict
 
-class StudentPreferenceUpdate(BaseModel):
+class StudentPreferenceUpdate(InputObj):
     project_area_id: PyObjectId
     preference_rank: int = Field(ge=1, le=10)
     interest_level: InterestLevel = InterestLevel.MEDIUM
@@ -121,3 +102,8 @@ class StudentInterestAnalytics(BaseModel):
     students_without_interests: int
     interest_level_trends: Dict
     preference_rank_trends: Dict
+
+
+class Page(BaseModel):
+    items: List[StudentInterestPublic]
+    next_cursor: Optional[str] = None
@@ -3,21 +3,16 @@ from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 from bson import ObjectId
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId, oid_str, oid_strs
 
 
-class Page(BaseModel):
-    items: List["StudentPublic"]
-    next_cursor: Optional[str] = None
-
-
-class StudentAssignmentRequest(BaseModel):
+class StudentAssignmentRequest(InputObj):
     student_ids: List[str]
     academic_year_id: PyObjectId
     supervisor_id: PyObjectId
 
 
-class StudentCreate(BaseModel):
+class StudentCreate(InputObj):
     title: Optional[str] = None
     surname: str
     otherNames: Optional[str] = None
@@ -38,7 +33,7 @@ class StudentCreate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class StudentUpdate(BaseModel):
+class StudentUpdate(InputObj):
     title: Optional[str] = None
     surname: Optional[str] = None
     otherNames: Optional[str] = None
@@ -66,10 +61,10 @@ class StudentPublic(Obj):
     phone: Optional[str] = None
     program: Optional[PyObjectId] = None
     level: Optional[PyObjectId] = None
-    createdAt: datetime = Field(validation_alias="createdAt")
-    updatedAt: Optional[datetime] = Field(default=None, validation_alias="updatedAt")
+    createdAt: datetime
+    updatedAt: Optional[datetime] = None
     academicId: Optional[str] = Field(default=None, validation_alias="studentID")
-    pin: Optional[str] = Field(default=None, validation_alias="pin")
+    pin: Optional[str] = None
     academicYears: Optional[List[PyObjectId]] = None
     deleted: bool = False
     type: str = "UNDERGRADUATE"
@@ -79,8 +74,39 @@ class StudentPublic(Obj):
     image: Optional[str] = None
     
     model_config = ConfigDict(populate_by_name=True)
+
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "StudentPublic":
+        """Build from a stored student without validation, converting only what validation would"""
+        return cls.model_construct(
+            id=str(doc["_id"]),
+            title=doc.get("title"),
+            surname=doc["surname"],
+            otherNames=doc.get("otherNames"),
+            email=doc["email"],
+            phone=doc.get("phone"),
+            program=oid_str(doc.get("program")),
+            level=oid_str(doc.get("level")),
+            createdAt=doc["createdAt"],
+            updatedAt=doc.get("updatedAt"),
+            # Older students were written with studentID, which validation reads first
+            academicId=doc["studentID"] if "studentID" in doc else doc.get("academicId"),
+            pin=doc.get("pin"),
+            academicYears=oid_strs(doc.get("academicYears")),
+            deleted=bool(doc.get("deleted", False)),
+            type=doc.get("type", "UNDERGRADUATE"),
+            admissionYear=oid_str(doc.get("admissionYear")),
+            currentAcademicYear=oid_str(doc.get("currentAcademicYear")),
+            classGroup=oid_str(doc.get("classGroup")),
+            image=doc.get("image"),
+        )
     
     
 class StudentLogin(BaseModel):
     academicId: Optional[str] = Field(default=None, validation_alias="academicID")
-    pin: Optional[str] = None
\ No newline at end of file
+    pin: Optional[str] = None
+
+
+class Page(BaseModel):
+    items: List[StudentPublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
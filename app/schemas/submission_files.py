@@ -3,7 +3,7 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 from enum import Enum
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
 class FileStatus(str, Enum):
@@ -13,12 +13,7 @@ class FileStatus(str, Enum):
     APPROVED = "approved"
 
 
-class Page(BaseModel):
-    items: List["SubmissionFilePublic"]
-    next_cursor: Optional[str] = None
-
-
-class SubmissionFileCreate(BaseModel):
+class SubmissionFileCreate(InputObj):
     submission_id: PyObjectId
     file_name: str
     file_path: str
@@ -29,7 +24,7 @@ class SubmissionFileCreate(BaseModel):
     status: FileStatus = FileStatus.PENDING_REVIEW
 
 
-class SubmissionFileUpdate(BaseModel):
+class SubmissionFileUpdate(InputObj):
     file_name: Optional[str] = None
     file_path: Optional[str] = None
     comments: Optional[str] = None
@@ -46,4 +41,9 @@ class SubmissionFilePublic(Obj):
     comments: Optional[str] = None
     status: FileStatus = FileStatus.PENDING_REVIEW
     uploaded_at: datetime = Field(validation_alias="createdAt")
-    updated_at: datetime = Field(validation_alias="updatedAt")
\ No newline at end of file
+    updated_at: datetime = Field(validation_alias="updatedAt")
+
+
+class Page(BaseModel):
+    items: List[SubmissionFilePublic]
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
 from enum import Enum
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 
 
 class SubmissionStatus(str, Enum):
@@ -14,12 +14,7 @@ class SubmissionStatus(str, Enum):
     APPROVED = "approved"
 
 
-class Page(BaseModel):
-    items: List["SubmissionPublic"]
-    next_cursor: Optional[str] = None
-
-
-class SubmissionCreate(BaseModel):
+class SubmissionCreate(InputObj):
     deliverable_id: PyObjectId
     project_id: PyObjectId
     group_id: PyObjectId
@@ -28,7 +23,7 @@ class SubmissionCreate(BaseModel):
     status: SubmissionStatus = SubmissionStatus.IN_PROGRESS
 
 
-class SubmissionUpdate(BaseModel):
+class SubmissionUpdate(InputObj):
     lecturer_feedback: Optional[str] = None
     status: Optional[SubmissionStatus] = None
 
@@ -45,10 +40,6 @@ class SubmissionPublic(Obj):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        populate_by_name = True
-        from_attributes = True
-
 
 class GroupSubmissionInfo(BaseModel):
     group_id: PyObjectId
@@ -70,3 +61,8 @@ class SubmissionDetailsResponse(BaseModel):
     group: Dict
     students: List[Dict] = []
     files: List[Dict] = []
+
+
+class Page(BaseModel):
+    items: List[SubmissionPublic]
+    next_cursor: Optional[str] = None
@@ -2,21 +2,16 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from app.schemas.base import Obj, PyObjectId
+from app.schemas.base import Obj, InputObj, PyObjectId
 from app.schemas.lecturers import LecturerPublic
 
 
-class Page(BaseModel):
-    items: List["SupervisorPublic"]
-    next_cursor: Optional[str] = None
-
-
-class SupervisorCreate(BaseModel):
+class SupervisorCreate(InputObj):
     lecturer_id: PyObjectId
     max_students: Optional[int] = None
 
 
-class SupervisorUpdate(BaseModel):
+class SupervisorUpdate(InputObj):
     lecturer_id: Optional[PyObjectId] = None
     max_students: Optional[int] = None
 
@@ -25,8 +20,8 @@ class SupervisorPublic(Obj):
     lecturer_id: PyObjectId
     max_students: Optional[int] = None
     project_student_count: int
-    createdAt: datetime = Field(validation_alias="createdAt", alias="createdAt")
-    updatedAt: datetime = Field(validation_alias="updatedAt", alias="updatedAt")
+    createdAt: datetime
+    updatedAt: datetime
 
 
 class SupervisorWithLecturer(BaseModel):
@@ -94,4 +89,44 @@ class StudentSupervisorResponse(BaseModel):
     student: StudentInfo
     supervisor: SupervisorInfo
     assignment: AssignmentInfo
-    project_area: Optional[ProjectAreaInfo] = None
\ No newline at end of file
+    project_area: Optional[ProjectAreaInfo] = None
+
+
+class SupervisorDetailInfo(BaseModel):
+    supervisor_id: str
+    academic_id: Optional[str] = None
+    max_students: Optional[int] = None
+    project_student_count: int = 0
+    createdAt: Optional[datetime] = None
+    updatedAt: Optional[datetime] = None
+
+
+class LecturerDetailInfo(BaseModel):
+    lecturer_id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    department: Optional[str] = None
+    title: Optional[str] = None
+    specialization: Optional[str] = None
+    academic_id: Optional[str] = None
+
+
+class AcademicYearInfo(BaseModel):
+    academic_year_id: str
+    title: Optional[str] = None
+    status: Optional[str] = None
+    terms: Optional[int] = None
+    current_term: Optional[int] = None
+
+
+class SupervisorDetail(BaseModel):
+    supervisor: SupervisorDetailInfo
+    lecturer: Optional[LecturerDetailInfo] = None
+    academic_year: Optional[AcademicYearInfo] = None
+    project_areas: List[ProjectAreaInfo] = []
+
+
+class Page(BaseModel):
+    items: List[SupervisorPublic]
+    next_cursor: Optional[str] = None
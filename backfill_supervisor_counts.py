@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Supervisor Student Count Backfill Script
+Seeds supervisors.project_student_count from the fyps collection; the fyps
+controller keeps it current afterwards
+"""
+
+import asyncio
+from pymongo import UpdateOne
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+
+async def backfill_supervisor_counts():
+    """Count fyps per supervisor reference and store the totals on supervisors"""
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    db = client[settings.DB_NAME]
+
+    print("🚀 Starting supervisor student count backfill...")
+    print(f"📊 Database: {settings.DB_NAME}")
+
+    # fyps reference a supervisor by its own _id or by its lecturer's _id
+    counts = {
+        row["_id"]: row["count"]
+        async for row in db.fyps.aggregate([
+            {"$match": {"supervisor": {"$ne": None}}},
+            {"$group": {"_id": "$supervisor", "count": {"$sum": 1}}}
+        ])
+    }
+
+    updates = []
+    async for supervisor in db.supervisors.find({}, {"lecturer_id": 1}):
+        count = counts.get(supervisor["_id"], 0) + counts.get(supervisor.get("lecturer_id"), 0)
+        updates.append(UpdateOne(
+            {"_id": supervisor["_id"]},
+            {"$set": {"project_student_count": count}}
+        ))
+
+    if updates:
+        result = await db.supervisors.bulk_write(updates, ordered=False)
+        print(f"✅ Updated {result.modified_count} of {len(updates)} supervisors")
+    else:
+        print("⏭️  No supervisors to update")
+
+    print(f"\n🎉 Backfill Complete!")
+
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_supervisor_counts())
@@ -105,6 +105,22 @@ async def init_collections():
     except Exception as e:
         print(f"⚠️  Index creation warning: {e}")
     
+    # Indexes for supervisors collection
+    try:
+        await db.supervisors.create_index("lecturer_id", unique=True)
+        print("✅ Created index on supervisors.lecturer_id")
+    except Exception as e:
+        print(f"⚠️  Index creation warning: {e}")
+    
+    # Indexes for fyps collection
+    try:
+        await db.fyps.create_index([("supervisor", 1)])
+        await db.fyps.create_index([("student", 1), ("createdAt", -1)])
+        await db.fyps.create_index([("checkin", 1)])
+        print("✅ Created indexes on fyps collection")
+    except Exception as e:
+        print(f"⚠️  Index creation warning: {e}")
+    
     # Indexes for programs collection
     try:
         await db.programs.create_index("code", unique=True)
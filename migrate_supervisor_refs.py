@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Supervisor Reference Migration Script
+Converts supervisor references on fyps and groups to the lecturer's ObjectId:
+string ids become ObjectId, and ids of supervisor documents are replaced by
+that supervisor's lecturer_id, so queries can match them with a single
+equality on the supervisor index
+"""
+
+import asyncio
+from bson import ObjectId
+from pymongo import UpdateOne
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+
+COLLECTIONS_TO_MIGRATE = ["fyps", "groups"]
+
+async def migrate_supervisor_refs():
+    """Rewrite supervisor references as the lecturer's ObjectId"""
+    client = AsyncIOMotorClient(settings.MONGO_URL)
+    db = client[settings.DB_NAME]
+
+    print("🚀 Starting supervisor reference migration...")
+    print(f"📊 Database: {settings.DB_NAME}")
+
+    # Supervisor document _id -> lecturer _id
+    lecturer_by_supervisor = {
+        supervisor["_id"]: ObjectId(supervisor["lecturer_id"])
+        async for supervisor in db.supervisors.find({"lecturer_id": {"$ne": None}}, {"lecturer_id": 1})
+        if ObjectId.is_valid(supervisor["lecturer_id"])
+    }
+
+    for collection_name in COLLECTIONS_TO_MIGRATE:
+        updates = []
+        skipped_count = 0
+
+        query = {"$or": [
+            {"supervisor": {"$type": "string"}},
+            {"supervisor": {"$in": list(lecturer_by_supervisor)}},
+        ]}
+        async for doc in db[collection_name].find(query, {"supervisor": 1}):
+            if not ObjectId.is_valid(doc["supervisor"]):
+                skipped_count += 1
+                continue
+
+            supervisor_ref = ObjectId(doc["supervisor"])
+            updates.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {"supervisor": lecturer_by_supervisor.get(supervisor_ref, supervisor_ref)}}
+            ))
+
+        if updates:
+            result = await db[collection_name].bulk_write(updates, ordered=False)
+            print(f"✅ Rewrote {result.modified_count} supervisor references in '{collection_name}'")
+        else:
+            print(f"⏭️  No supervisor references to rewrite in '{collection_name}'")
+
+        if skipped_count:
+            print(f"⚠️  Skipped {skipped_count} invalid supervisor ids in '{collection_name}'")
+
+    print(f"\n🎉 Migration Complete!")
+
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(migrate_supervisor_refs())
@@ -13,4 +13,4 @@
 #   src.api.main:app \
 #   --bind 0.0.0.0:${PORT:-8080}
 
-uvicorn app.api.main:app --host 0.0.0.0 --port ${PORT:-8080}
\ No newline at end of file
+uvicorn app.api.main:app --host 0.0.0.0 --port ${PORT:-8080} --loop uvloop --http httptools
\ No newline at end of file
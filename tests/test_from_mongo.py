@@ -0,0 +1,117 @@
+import os
+import unittest
+from datetime import datetime
+
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+for name, value in {
+    "MONGO_URL": "mongodb://localhost", "DB_NAME": "test", "SECRET_KEY": "test", "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_DAYS": "1", "CLOUDINARY_CLOUD_NAME": "test", "CLOUDINARY_API_KEY": "test",
+    "CLOUDINARY_API_SECRET": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+from app.core.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.schemas.lecturers import LecturerPublic, Page as LecturerPage  # noqa: E402
+from app.schemas.programs import ProgramPublic, Page as ProgramPage  # noqa: E402
+from app.schemas.students import StudentPublic  # noqa: E402
+
+NOW = datetime(2024, 5, 1, 12, 30)
+
+
+class FakeCollection:
+    """Serves one stored document to find_one and find"""
+
+    def __init__(self, doc: dict):
+        self.doc = doc
+
+    async def find_one(self, query, *args, **kwargs):
+        return self.doc
+
+    def find(self, query, *args, **kwargs):
+        return self
+
+    def limit(self, limit):
+        return self
+
+    async def to_list(self, length):
+        return [self.doc]
+
+
+def fake_db(collection: str, doc: dict):
+    async def get_fake_db():
+        yield {collection: FakeCollection(doc)}
+    return get_fake_db
+
+
+def validated(response_model, content):
+    """Serve raw documents through response_model validation, as these routes did before"""
+    reference = FastAPI()
+
+    @reference.get("/", response_model=response_model)
+    async def route():
+        return content
+
+    return TestClient(reference, raise_server_exceptions=False).get("/")
+
+
+class FromMongoRoutesTest(unittest.TestCase):
+    """Routes built with from_mongo must serve exactly what response_model validation served before"""
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def served(self, path: str, collection: str, doc: dict):
+        app.dependency_overrides[get_db] = fake_db(collection, doc)
+        return TestClient(app, raise_server_exceptions=False).get(f"/api/v1{path}")
+
+    def assert_same_as_validation(self, response_model, path: str, collection: str, doc: dict):
+        expected_content = {"items": [doc], "next_cursor": None} if response_model.__name__ == "Page" else doc
+        served, expected = self.served(path, collection, doc), validated(response_model, expected_content)
+        self.assertEqual(served.status_code, expected.status_code)
+        self.assertEqual(served.json(), expected.json())
+
+    def test_student_documents(self):
+        docs = [
+            # Legacy student written with studentID and numeric references
+            {"_id": ObjectId(), "surname": "Mensah", "email": "m@st.edu", "studentID": "10950001",
+             "level": 100, "program": "BSc Computer Science", "createdAt": NOW},
+            # Current student without updatedAt, with ObjectId references
+            {"_id": ObjectId(), "surname": "Owusu", "otherNames": "Ama", "email": "o@st.edu",
+             "academicId": "10950002", "program": ObjectId(), "level": ObjectId(),
+             "academicYears": [ObjectId(), ObjectId()], "createdAt": NOW, "extra": {"a": ObjectId()}},
+            # Values validation coerces: int flag, mixed id list
+            {"_id": ObjectId(), "surname": "Boateng", "email": "b@st.edu", "createdAt": NOW,
+             "updatedAt": NOW, "deleted": 0, "academicYears": [ObjectId(), 2024]},
+        ]
+        for doc in docs:
+            with self.subTest(doc=doc):
+                self.assert_same_as_validation(StudentPublic, f"/students/{doc['_id']}", "students", doc)
+
+    def test_lecturer_and_program_documents(self):
+        lecturer = {
+            "_id": ObjectId(), "surname": "Asante", "academicId": "L001", "pin": "1234", "email": "a@st.edu",
+            "committees": ["exams"], "projectAreas": [ObjectId()], "createdAt": NOW, "updatedAt": NOW,
+        }
+        program = {
+            "_id": ObjectId(), "title": "Computer Science", "tag": "CS", "description": "", "code": "CS",
+            "createdBy": ObjectId(), "createdAt": NOW, "updatedAt": NOW,
+        }
+        self.assert_same_as_validation(LecturerPublic, f"/lecturers/{lecturer['_id']}", "lecturers", lecturer)
+        self.assert_same_as_validation(LecturerPage, "/lecturers", "lecturers", lecturer)
+        self.assert_same_as_validation(ProgramPublic, f"/programs/{program['_id']}", "programs", program)
+        self.assert_same_as_validation(ProgramPage, "/programs", "programs", program)
+
+    def test_missing_required_field_fails(self):
+        lecturer = {"_id": ObjectId(), "surname": "Asante", "academicId": "L001", "pin": "1234",
+                    "email": "a@st.edu", "createdAt": NOW}
+        served = self.served(f"/lecturers/{lecturer['_id']}", "lecturers", lecturer)
+        self.assertEqual(served.status_code, 500)
+        self.assertEqual(validated(LecturerPublic, lecturer).status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+from app.core import cache, websocket_manager
+from app.core.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(json.loads(data))
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        async def iterate():
+            for doc in self.docs:
+                yield doc
+        return iterate()
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = 0
+
+    async def find_one(self, query, projection=None):
+        self.queries += 1
+        refs = [clause[key] for clause in query["$or"] for key in clause]
+        return next((doc for doc in self.docs if doc["_id"] in refs or doc.get("lecturer_id") in refs), None)
+
+    def find(self, query, projection=None):
+        self.queries += 1
+        refs = query["supervisor"]["$in"]
+        return FakeCursor([doc for doc in self.docs if doc.get("supervisor") in refs])
+
+
+class BroadcastToSupervisorStudentsTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        websocket_manager._supervisor_students.clear()
+        self.supervisor_id, self.lecturer_id = ObjectId(), ObjectId()
+        self.students = [ObjectId(), ObjectId()]
+        self.db = {
+            "supervisors": FakeCollection([{"_id": self.supervisor_id, "lecturer_id": self.lecturer_id}]),
+            "fyps": FakeCollection([
+                # fyps may reference the supervisor document or its lecturer
+                {"supervisor": self.lecturer_id, "student": self.students[0]},
+                {"supervisor": self.supervisor_id, "student": self.students[1]},
+                {"supervisor": ObjectId(), "student": ObjectId()},
+            ]),
+        }
+
+    async def connect(self, manager, user_id):
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, str(user_id), {})
+        return websocket
+
+    async def broadcast(self, manager, message, sender_id):
+        await manager.broadcast_to_supervisor_students(message, str(self.lecturer_id), str(sender_id), self.db)
+        await asyncio.sleep(0)
+
+    async def test_reaches_students_of_both_references_except_the_sender(self):
+        manager = ConnectionManager()
+        first, second = [await self.connect(manager, student) for student in self.students]
+
+        await self.broadcast(manager, {"type": "announcement", "text": "hi"}, sender_id=self.students[0])
+
+        self.assertNotIn({"type": "announcement", "text": "hi"}, first.sent)
+        self.assertIn({"type": "announcement", "text": "hi"}, second.sent)
+
+    async def test_student_ids_are_cached_for_five_seconds(self):
+        manager = ConnectionManager()
+        await self.connect(manager, self.students[1])
+        now = 1000.0
+
+        with mock.patch.object(cache.time, "monotonic", lambda: now):
+            await self.broadcast(manager, {"n": 1}, sender_id=self.lecturer_id)
+            queries = self.db["supervisors"].queries + self.db["fyps"].queries
+
+            now += 4.9
+            await self.broadcast(manager, {"n": 2}, sender_id=self.lecturer_id)
+            self.assertEqual(self.db["supervisors"].queries + self.db["fyps"].queries, queries)
+
+            now += 0.2
+            await self.broadcast(manager, {"n": 3}, sender_id=self.lecturer_id)
+            self.assertGreater(self.db["supervisors"].queries + self.db["fyps"].queries, queries)
+
+
+if __name__ == "__main__":
+    unittest.main()